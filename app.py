@@ -3,18 +3,33 @@ from __future__ import annotations
 import sys
 import logging
 from logging.handlers import RotatingFileHandler
-from dataclasses import asdict, dataclass
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
-import json
 import re
+from functools import lru_cache
 import numpy as np
+import orjson
 import pandas as pd
-from PySide6.QtCore import QAbstractTableModel, QDate, QDateTime, QMargins, QTimer, QModelIndex, Qt
-from PySide6.QtGui import QAction, QCursor, QFont, QPainter
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QAbstractTableModel,
+    QDate,
+    QDateTime,
+    QMargins,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QAction, QCursor, QFont, QOpenGLContext, QPainter
 from PySide6.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QCheckBox,
     QComboBox,
@@ -29,6 +44,7 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMainWindow,
@@ -58,23 +74,273 @@ from PySide6.QtCharts import (
     QLineSeries,
     QScatterSeries,
     QValueAxis,
+    QXYSeries,
 )
 
-from core import load_config, save_config, safe_update, load_latest_df
+from core import load_config, save_config, safe_update, load_latest_df, with_arrow_strings
+
+pd.set_option("mode.copy_on_write", True)
+
+
+def cell_formatter(series: pd.Series) -> Callable[[Any], str]:
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return lambda value: str(pd.Timestamp(value))
+    if pd.api.types.is_timedelta64_dtype(series):
+        return lambda value: str(pd.Timedelta(value))
+    return str
+
+
+def column_values(series: pd.Series) -> np.ndarray:
+    if pd.api.types.is_extension_array_dtype(series.dtype):
+        return series.to_numpy(dtype=object)
+    return series.to_numpy()
+
+
+METRIC_REDUCERS: Dict[str, Callable[..., np.ndarray]] = {
+    "mean": np.nanmean,
+    "median": np.nanmedian,
+    "min": np.nanmin,
+    "max": np.nanmax,
+}
+
+
+def metric_aggregates(df: pd.DataFrame, cols: List[str], agg: str) -> List[float]:
+    values = df[cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    counts = np.count_nonzero(~np.isnan(values), axis=0)
+    if agg == "count":
+        return counts.astype(np.float64).tolist()
+    result = np.zeros(len(cols))
+    present = counts > 0
+    if present.any():
+        result[present] = METRIC_REDUCERS.get(agg, np.nansum)(values[:, present], axis=0)
+    return result.tolist()
+
+
+def histogram(series: pd.Series, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+    values = numeric_values(series)
+    bounds = array_range(values)
+    if bounds is None:
+        values = values[:0]
+    return np.histogram(values, bins=bins, range=bounds)
+
+
+def chart_aggregate(
+    df: pd.DataFrame, group_cols: List[str], y_col: Optional[str], agg: str
+) -> Tuple[pd.DataFrame, str]:
+    if y_col is None or agg == "count":
+        return df.groupby(group_cols, dropna=False).size().reset_index(name="count"), "count"
+    value_name = f"{y_col}_{agg}" if y_col in group_cols else y_col
+    grouped = df.groupby(group_cols, dropna=False)[y_col].agg(agg).rename(value_name)
+    return grouped.reset_index(), value_name
+
+
+def top_rows(df: pd.DataFrame, col: str, n: int) -> pd.DataFrame:
+    values = numeric_values(df[col]).astype(np.float64)
+    ranked = pd.Series(np.where(np.isnan(values), -np.inf, values)).nlargest(n)
+    return df.iloc[ranked.index.to_numpy()]
+
+
+def string_codes(series: pd.Series) -> Tuple[np.ndarray, List[str]]:
+    # Object and float labels can collide or split once stringified (1 vs "1", -0.0 vs 0.0).
+    if series.dtype == object or series.dtype.kind in "fc":
+        codes, uniques = pd.factorize(series.astype(str))
+        return codes, uniques.tolist()
+    codes, uniques = pd.factorize(series, use_na_sentinel=False)
+    uniques = pd.Index(uniques)
+    labels = uniques.astype(str)
+    if isinstance(series.dtype, pd.StringDtype):
+        # Missing text keeps the "nan" label it had as object dtype rather than the Arrow dtype's "<NA>".
+        labels = labels.where(uniques.notna(), "nan")
+    if not labels.is_unique:
+        remap, labels = pd.factorize(labels)
+        codes = remap[codes]
+    return codes, labels.tolist()
+
+
+def category_order(series: pd.Series, codes: np.ndarray, categories: List[str]) -> np.ndarray:
+    if isinstance(series.dtype, pd.StringDtype) or (series.dtype == object and pd.api.types.is_string_dtype(series)):
+        rank = np.empty(len(categories), dtype=np.int64)
+        rank[np.argsort(np.array(categories), kind="stable")] = np.arange(len(categories))
+        keys = rank[codes]
+        keys[series.isna().to_numpy()] = len(categories)
+        return np.argsort(keys, kind="stable")
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        keys = series.cat.codes.to_numpy().astype(np.int64)
+        keys[keys < 0] = len(series.cat.categories)
+        return np.argsort(keys, kind="stable")
+    return series.reset_index(drop=True).sort_values(kind="stable").index.to_numpy()
+
+
+def joined_labels(df: pd.DataFrame, cols: List[str]) -> pd.Series:
+    # Join the distinct labels once per combination instead of concatenating strings per row.
+    codes, labels = string_codes(df[cols[0]])
+    for col in cols[1:]:
+        more_codes, more_labels = string_codes(df[col])
+        width = len(more_labels)
+        codes, pairs = pd.factorize(codes.astype(np.int64) * width + more_codes)
+        labels = [f"{labels[pair // width]} / {more_labels[pair % width]}" for pair in pairs.tolist()]
+    return pd.Series(np.array(labels, dtype=object)[codes], index=df.index)
+
+
+def numeric_values(series: pd.Series) -> np.ndarray:
+    if pd.api.types.is_extension_array_dtype(series.dtype):
+        return series.to_numpy(dtype=np.float64, na_value=np.nan)
+    return series.to_numpy()
+
+
+def replace_points(series: QXYSeries, xs: np.ndarray, ys: np.ndarray) -> None:
+    series.replaceNp(np.ascontiguousarray(xs, dtype=np.float64), np.ascontiguousarray(ys, dtype=np.float64))
+
+
+def min_max_rows(values: np.ndarray, limit: int) -> np.ndarray:
+    if len(values) <= limit:
+        return np.arange(len(values))
+    edges = np.linspace(0, len(values), limit // 2 + 1).astype(np.int64)
+    starts, sizes = edges[:-1], np.diff(edges)
+    positions = np.arange(len(values))
+    # First minimum ignoring NaN, last maximum with NaN winning, per bucket, without sorting.
+    lows = np.repeat(np.fmin.reduceat(values, starts), sizes)
+    first_low = np.minimum.reduceat(np.where(values == lows, positions, len(values)), starts)
+    first_low = np.where(first_low < len(values), first_low, starts)
+    highs = np.repeat(np.maximum.reduceat(values, starts), sizes)
+    is_high = (values == highs) | (np.isnan(values) & np.isnan(highs))
+    last_high = np.maximum.reduceat(np.where(is_high, positions, -1), starts)
+    return np.unique(np.concatenate((first_low, last_high)))
+
+
+def epoch_ms(series: pd.Series) -> np.ndarray:
+    if getattr(series.dtype, "tz", None) is not None:
+        series = series.dt.tz_convert(None)
+    return series.to_numpy(dtype="datetime64[ms]").view(np.int64)
+
+
+def array_range(values: np.ndarray) -> Optional[Tuple[float, float]]:
+    if not values.size:
+        return None
+    low = np.fmin.reduce(values)
+    if np.isnan(low):
+        return None
+    return float(low), float(np.fmax.reduce(values))
+
+
+def value_range(series: pd.Series) -> Optional[Tuple[float, float]]:
+    return array_range(numeric_values(series).astype(np.float64, copy=False))
+
+
+def split_groups(rows: np.ndarray, codes: np.ndarray, groups: int) -> List[np.ndarray]:
+    bounds = np.cumsum(np.bincount(codes, minlength=groups))[:-1]
+    if groups <= np.iinfo(np.int16).max:
+        codes = codes.astype(np.int16)
+    return np.split(rows[np.argsort(codes, kind="stable")], bounds)
+
+
+def box_stats(codes: np.ndarray, values: np.ndarray, groups: int) -> np.ndarray:
+    counts = np.bincount(codes, minlength=groups)
+    starts = (np.cumsum(counts) - counts)[:, None]
+    if groups <= np.iinfo(np.int16).max:
+        codes = codes.astype(np.int16)
+    # Sort by value, then stably by group (radix on int16 codes): cheaper than a two-key lexsort.
+    by_value = np.argsort(values)
+    ordered = values[by_value[np.argsort(codes[by_value], kind="stable")]]
+    positions = (counts - 1)[:, None] * np.array([0.0, 0.25, 0.5, 0.75, 1.0])
+    low = np.floor(positions).astype(np.int64)
+    high = np.ceil(positions).astype(np.int64)
+    low_values = ordered[starts + low]
+    return low_values + (ordered[starts + high] - low_values) * (positions - low)
+
+
+def range_mask(ranges: List[Tuple[np.ndarray, float, float]], size: int) -> np.ndarray:
+    mask = np.ones(size, dtype=bool)
+    scratch = np.empty(size, dtype=bool)
+    for values, low, high in ranges:
+        mask &= np.greater_equal(values, low, out=scratch)
+        mask &= np.less_equal(values, high, out=scratch)
+    return mask
+
+
+def filter_options(series: pd.Series, limit: int) -> Tuple[pd.Index, np.ndarray, bool]:
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        options, codes = series.cat.categories, series.cat.codes.to_numpy()
+    else:
+        codes, uniques = pd.factorize(series)
+        options = pd.Index(uniques)
+    if len(options) <= limit:
+        return options, codes, False
+    keep = pd.Series(np.bincount(codes[codes >= 0], minlength=len(options))).nlargest(limit).index.to_numpy()
+    position = np.full(len(options) + 1, -1, dtype=np.intp)
+    position[keep] = np.arange(len(keep))
+    return options[keep], position[codes], True
+
+
+def parse_dates(series: pd.Series) -> pd.Series:
+    # Text columns that are not dates fall back to dateutil per value, so only parse each distinct value once.
+    codes, uniques = pd.factorize(series)
+    parsed = pd.Index(pd.to_datetime(uniques, errors="coerce"))
+    return pd.Series(parsed.take(codes, allow_fill=True, fill_value=pd.NaT), index=series.index, name=series.name)
+
+
+def local_ns(series: pd.Series) -> np.ndarray:
+    if series.dt.tz is not None:
+        series = series.dt.tz_localize(None)
+    return series.to_numpy(dtype="datetime64[ns]").view("i8")
+
+
+def day_epoch(day: date) -> int:
+    return int(np.datetime64(day, "ns").astype(np.int64))
+
+
+def is_missing(value: Any) -> bool:
+    return value is None or value is pd.NA or value is pd.NaT or value != value
 
 
 class DataFrameModel(QAbstractTableModel):
-    def __init__(self, df: pd.DataFrame) -> None:
+    def __init__(self, df: pd.DataFrame, row_cap: Optional[int] = None) -> None:
         super().__init__()
         self._df = df
+        self._row_cap = row_cap
+        self._reset_rows()
 
     def set_df(self, df: pd.DataFrame) -> None:
         self.beginResetModel()
         self._df = df
+        self._reset_rows()
         self.endResetModel()
 
+    def _reset_rows(self) -> None:
+        if self._df is None:
+            self._total = self._loaded = 0
+            self._texts: List[List[str]] = []
+            self._headers: List[str] = []
+            self._row_labels: List[str] = []
+            return
+        rows = len(self._df.index)
+        self._total = rows if self._row_cap is None else min(rows, self._row_cap)
+        self._loaded = min(self._total, PREVIEW_FETCH_ROWS)
+        self._texts = [[] for _ in range(self._df.shape[1])]
+        self._headers = [str(col) for col in self._df.columns]
+        self._row_labels = []
+
+    def _column_texts(self, col: int) -> List[str]:
+        texts = self._texts[col]
+        if len(texts) < self._loaded:
+            series = self._df.iloc[len(texts) : min(self._total, 2 * self._loaded), col]
+            formatter = cell_formatter(series)
+            texts.extend("" if is_missing(value) else formatter(value) for value in column_values(series))
+        return texts
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._loaded < self._total
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        rows = min(self._total, self._loaded + PREVIEW_FETCH_ROWS)
+        self.beginInsertRows(QModelIndex(), self._loaded, rows - 1)
+        self._loaded = rows
+        self.endInsertRows()
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        return 0 if self._df is None else len(self._df.index)
+        return 0 if parent.isValid() else self._loaded
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         return 0 if self._df is None else len(self._df.columns)
@@ -83,8 +349,7 @@ class DataFrameModel(QAbstractTableModel):
         if not index.isValid() or self._df is None:
             return None
         if role == Qt.DisplayRole:
-            value = self._df.iloc[index.row(), index.column()]
-            return "" if pd.isna(value) else str(value)
+            return self._column_texts(index.column())[index.row()]
         return None
 
     def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
@@ -93,11 +358,106 @@ class DataFrameModel(QAbstractTableModel):
         if role != Qt.DisplayRole:
             return None
         if orientation == Qt.Horizontal:
-            return str(self._df.columns[section])
-        return str(self._df.index[section])
+            return self._headers[section]
+        if section >= len(self._row_labels):
+            start = len(self._row_labels)
+            self._row_labels.extend(str(label) for label in self._df.index[start : min(self._total, 2 * self._loaded)])
+        return self._row_labels[section]
+
+
+class CheckListModel(QAbstractListModel):
+    checked_changed = Signal()
+
+    def __init__(self, labels: Optional[List[str]] = None, values: Optional[List[Any]] = None) -> None:
+        super().__init__()
+        labels = labels or []
+        self._labels = labels
+        self._values = labels if values is None else values
+        self._tooltips: Optional[List[str]] = None
+        self._checked = np.ones(len(labels), dtype=np.uint8)
+
+    def reset(self, labels: List[str], checked: Set[str], tooltips: Optional[List[str]] = None) -> None:
+        self.beginResetModel()
+        self._labels = labels
+        self._values = labels
+        self._tooltips = tooltips
+        self._checked = pd.Index(labels, dtype=object).isin(list(checked)).astype(np.uint8)
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._labels)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.DisplayRole:
+            return self._labels[row]
+        if role == Qt.CheckStateRole:
+            return Qt.Checked if self._checked[row] else Qt.Unchecked
+        if role == Qt.UserRole:
+            return self._values[row]
+        if role == Qt.ToolTipRole and self._tooltips is not None:
+            return self._tooltips[row]
+        return None
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.CheckStateRole:
+            return False
+        self._checked[index.row()] = Qt.CheckState(value) == Qt.Checked
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        self.checked_changed.emit()
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsUserCheckable
+
+    def labels(self) -> List[str]:
+        return self._labels
+
+    def values(self) -> List[Any]:
+        return self._values
+
+    def checked_rows(self) -> np.ndarray:
+        return np.flatnonzero(self._checked)
+
+    def checked_labels(self) -> List[str]:
+        return [self._labels[i] for i in np.flatnonzero(self._checked)]
+
+    def set_checked(self, checked: np.ndarray) -> None:
+        self._checked[:] = checked
+        if len(self._labels):
+            self.dataChanged.emit(self.index(0), self.index(len(self._labels) - 1), [Qt.CheckStateRole])
+        self.checked_changed.emit()
+
+    def set_checked_labels(self, checked: Set[str]) -> None:
+        self.set_checked(pd.Index(self._labels, dtype=object).isin(list(checked)))
+
+    def set_tooltip(self, label: str, text: str) -> None:
+        if self._tooltips is None or label not in self._labels:
+            return
+        row = self._labels.index(label)
+        self._tooltips[row] = text
+        self.dataChanged.emit(self.index(row), self.index(row), [Qt.ToolTipRole])
+
+
+class LoadSignals(QObject):
+    finished = Signal(object, object)
+
+
+class LoadTask(QRunnable):
+    def __init__(self, path: str, encoding: str, signals: LoadSignals) -> None:
+        super().__init__()
+        self.path = path
+        self.encoding = encoding
+        self.signals = signals
+
+    def run(self) -> None:
+        df, err = safe_update(self.path, self.encoding, "manual")
+        self.signals.finished.emit(df, err)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChartConfig:
     chart_type: str
     x_col: Optional[str]
@@ -117,6 +477,9 @@ class ChartConfig:
     pivot_chart_type: Optional[str] = None
     pivot_values_in_columns: Optional[bool] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
 
 BASE_DIR = Path(sys.executable).resolve().parent if getattr(sys, "frozen", False) else Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
@@ -124,6 +487,22 @@ TEMPLATES_PATH = DATA_DIR / "templates.json"
 COLUMN_META_PATH = DATA_DIR / "column_meta.json"
 LOG_PATH = DATA_DIR / "app.log"
 METRIC_X_LABEL = "(度量)"
+PREVIEW_ROW_CAP = 200_000
+PREVIEW_FETCH_ROWS = 500
+PREVIEW_DEBOUNCE_MS = 150
+DASHBOARD_DEBOUNCE_MS = 150
+LINE_MAX_POINTS = 2000
+SCATTER_MAX_POINTS = 8000
+DATE_SAMPLE_SIZE = 1000
+OPENGL_MIN_POINTS = 1000
+FILTER_GROUP_STYLE = (
+    "QGroupBox { margin-top: 12px; }"
+    "QGroupBox::title { subcontrol-origin: margin; left: 8px; padding: 0 4px; }"
+    "QLabel#filterDescription { color: #b5b5b5; font-size: 12px; }"
+)
+DATE_TOKEN_RE = re.compile(r"\{date(?::([^}]+))?\}")
+FAST_PIVOT_AGGS = {"sum", "mean", "count", "min", "max"}
+JSON_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
 
 
 def ensure_data_dir() -> None:
@@ -135,16 +514,16 @@ def load_templates() -> List[Dict[str, Any]]:
     if not TEMPLATES_PATH.exists():
         return []
     try:
-        with TEMPLATES_PATH.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        with TEMPLATES_PATH.open("rb") as f:
+            return orjson.loads(f.read())
     except Exception:
         return []
 
 
 def save_templates(templates: List[Dict[str, Any]]) -> None:
     ensure_data_dir()
-    with TEMPLATES_PATH.open("w", encoding="utf-8") as f:
-        json.dump(templates, f, indent=2, ensure_ascii=False)
+    with TEMPLATES_PATH.open("wb") as f:
+        f.write(orjson.dumps(templates, option=JSON_DUMP_OPTIONS))
 
 
 def load_column_meta() -> Dict[str, str]:
@@ -152,8 +531,8 @@ def load_column_meta() -> Dict[str, str]:
     if not COLUMN_META_PATH.exists():
         return {}
     try:
-        with COLUMN_META_PATH.open("r", encoding="utf-8") as f:
-            data = json.load(f)
+        with COLUMN_META_PATH.open("rb") as f:
+            data = orjson.loads(f.read())
         if isinstance(data, dict):
             return {str(k): str(v) for k, v in data.items()}
     except Exception:
@@ -163,8 +542,8 @@ def load_column_meta() -> Dict[str, str]:
 
 def save_column_meta(meta: Dict[str, str]) -> None:
     ensure_data_dir()
-    with COLUMN_META_PATH.open("w", encoding="utf-8") as f:
-        json.dump(meta, f, indent=2, ensure_ascii=False)
+    with COLUMN_META_PATH.open("wb") as f:
+        f.write(orjson.dumps(meta, option=JSON_DUMP_OPTIONS))
 
 
 def setup_logging() -> None:
@@ -184,6 +563,20 @@ def setup_logging() -> None:
     sys.excepthook = handle_exception
 
 
+@lru_cache(maxsize=None)
+def trailing_digits_re(width: int) -> re.Pattern[str]:
+    return re.compile(rf"(\d{{{width}}})(?!.*\d)")
+
+
+@lru_cache(maxsize=None)
+def opengl_available() -> bool:
+    return QOpenGLContext().create()
+
+
+def use_opengl(points: int) -> bool:
+    return points > OPENGL_MIN_POINTS and opengl_available()
+
+
 def next_template_name(templates: List[Dict[str, Any]]) -> str:
     existing = {tpl.get("name", "") for tpl in templates}
     idx = 1
@@ -192,12 +585,100 @@ def next_template_name(templates: List[Dict[str, Any]]) -> str:
     return f"模板{idx}"
 
 
+@lru_cache(maxsize=None)
+def json_normalizer(kind: type) -> Optional[Callable[[Any], Any]]:
+    if issubclass(kind, (np.integer, np.floating)):
+        return kind.item
+    if issubclass(kind, (pd.Timestamp, datetime)):
+        return kind.isoformat
+    return None
+
+
 def normalize_json_value(value: Any) -> Any:
-    if isinstance(value, (np.integer, np.floating)):
-        return value.item()
-    if isinstance(value, (pd.Timestamp, datetime)):
-        return value.isoformat()
-    return value
+    normalizer = json_normalizer(type(value))
+    return normalizer(value) if normalizer is not None else value
+
+
+def columnar_frame(df: pd.DataFrame) -> pd.DataFrame:
+    strided = [
+        col
+        for col, dtype in df.dtypes.items()
+        if isinstance(dtype, np.dtype) and not df[col].to_numpy().flags.c_contiguous
+    ]
+    if not strided:
+        return df
+    return df.assign(**{col: np.ascontiguousarray(df[col].to_numpy()) for col in strided})
+
+
+def as_categorical_keys(df: pd.DataFrame, keys: List[str]) -> pd.DataFrame:
+    casts = {
+        col: df[col].astype("category")
+        for col in dict.fromkeys(keys)
+        if df[col].dtype == object or isinstance(df[col].dtype, pd.StringDtype)
+    }
+    return df.assign(**casts) if casts else df
+
+
+def key_product(table: Union[pd.DataFrame, pd.Series]) -> Union[pd.DataFrame, pd.Series]:
+    # pivot_table(dropna=False) lists every combination of the key values, not only the observed ones.
+    for axis in range(table.ndim):
+        labels = table.axes[axis]
+        if isinstance(labels, pd.MultiIndex):
+            table = table.reindex(pd.MultiIndex.from_product(labels.levels, names=labels.names), axis=axis, fill_value=0)
+    return table
+
+
+def flatten_column_labels(columns: pd.MultiIndex) -> List[str]:
+    return [" / ".join(filter(None, map(str, col))) for col in columns.to_flat_index()]
+
+
+def index_labels(index: pd.MultiIndex) -> List[str]:
+    parts = [
+        np.append(level.map(str).to_numpy(dtype=object), "nan")[codes] for level, codes in zip(index.levels, index.codes)
+    ]
+    labels = parts[0]
+    for part in parts[1:]:
+        labels = labels + " / " + part
+    return labels.tolist()
+
+
+def chart_key(cfg: ChartConfig) -> bytes:
+    return orjson.dumps(cfg.to_dict())
+
+
+def adopt_chart(target: QChart, source: Optional[QChart]) -> None:
+    target.removeAllSeries()
+    for axis in target.axes():
+        target.removeAxis(axis)
+        axis.deleteLater()
+    if source is None:
+        target.setTitle("")
+        return
+    target.setTitle(source.title())
+    target.setMargins(source.margins())
+    axes = [(axis, axis.alignment()) for axis in source.axes()]
+    attached = [(series, series.attachedAxes()) for series in source.series()]
+    for series, _ in attached:
+        source.removeSeries(series)
+    for axis, _ in axes:
+        source.removeAxis(axis)
+    for axis, alignment in axes:
+        target.addAxis(axis, alignment)
+    for series, series_axes in attached:
+        target.addSeries(series)
+        for axis in series_axes:
+            series.attachAxis(axis)
+
+
+def fill_check_list(widget: QListWidget, labels: List[str], checked: Set[str]) -> None:
+    widget.blockSignals(True)
+    widget.setUpdatesEnabled(False)
+    widget.clear()
+    widget.addItems(labels)
+    for idx, label in enumerate(labels):
+        widget.item(idx).setCheckState(Qt.Checked if label in checked else Qt.Unchecked)
+    widget.setUpdatesEnabled(True)
+    widget.blockSignals(False)
 
 
 def attach_bar_tooltips(bar_set: QBarSet, categories: List[str]) -> None:
@@ -222,17 +703,37 @@ class MainWindow(QMainWindow):
 
         self.df: Optional[pd.DataFrame] = None
         self.filtered_df: Optional[pd.DataFrame] = None
-        self.parsed_dates: Dict[str, pd.Series] = {}
+        self.filter_mask: Optional[np.ndarray] = None
+        self.parsed_dates: Dict[str, Optional[pd.Series]] = {}
+        self.filter_sources: Dict[str, Dict[str, Any]] = {}
+        self.date_lookups: Dict[str, Optional[pd.Series]] = {}
+        self.all_cols: List[str] = []
+        self.numeric_cols: List[str] = []
+        self.column_series: Dict[str, pd.Series] = {}
+        self.filter_col_lower: List[str] = []
         self.filter_controls: Dict[str, Dict[str, Any]] = {}
         self.charts: List[ChartConfig] = []
+        self.dashboard_keys: List[Tuple[bytes, int]] = []
+        self.dashboard_frames: List[QFrame] = []
+        self.dashboard_generation = 0
+        self.histogram_cache: Dict[Tuple[str, int], Tuple[np.ndarray, np.ndarray]] = {}
+        self.pivot_cache: Dict[Tuple[Any, ...], Tuple[pd.DataFrame, Union[pd.DataFrame, pd.Series]]] = {}
+        self.aggregate_cache: Dict[Tuple[Any, ...], Tuple[pd.DataFrame, str]] = {}
         self.templates: List[Dict[str, Any]] = []
         self.filter_dialog: Optional[QDialog] = None
         self.filter_summary_label: Optional[QLabel] = None
         self.pivot_df: Optional[pd.DataFrame] = None
+        self.pivot_checked: Dict[str, Set[str]] = {"rows": set(), "cols": set(), "vals": set()}
         self.column_meta: Dict[str, str] = load_column_meta()
         self._preview_timer = QTimer(self)
         self._preview_timer.setSingleShot(True)
         self._preview_timer.timeout.connect(self.refresh_preview)
+        self._dashboard_timer = QTimer(self)
+        self._dashboard_timer.setSingleShot(True)
+        self._dashboard_timer.timeout.connect(self._refresh_dashboard_now)
+        self._load_signals = LoadSignals(self)
+        self._load_signals.finished.connect(self._on_load_finished)
+        self._pending_load: Optional[Tuple[str, bool, Optional[Callable[[bool], None]]]] = None
 
         self._build_ui()
         self._load_initial_data()
@@ -396,16 +897,16 @@ class MainWindow(QMainWindow):
         self.filter_search.setPlaceholderText("搜尋欄位…")
         self.filter_search.textChanged.connect(self.filter_column_items)
         layout.addWidget(self.filter_search)
-        self.filter_column_list = QListWidget()
-        self.filter_column_list.itemChanged.connect(self.rebuild_filter_widgets)
+        self.filter_column_model = CheckListModel()
+        self.filter_column_model.checked_changed.connect(self.rebuild_filter_widgets)
+        self.filter_column_list = QListView()
+        self.filter_column_list.setUniformItemSizes(True)
+        self.filter_column_list.setModel(self.filter_column_model)
         layout.addWidget(self.filter_column_list)
 
         self.filter_area = QScrollArea()
         self.filter_area.setWidgetResizable(True)
-        self.filter_area_widget = QWidget()
-        self.filter_area_layout = QVBoxLayout(self.filter_area_widget)
-        self.filter_area_layout.setSpacing(20)
-        self.filter_area_layout.setContentsMargins(6, 6, 6, 6)
+        self.filter_area_widget, self.filter_area_layout = self._new_filter_container()
         self.filter_area_layout.addStretch(1)
         self.filter_area.setWidget(self.filter_area_widget)
         layout.addWidget(self.filter_area)
@@ -447,11 +948,13 @@ class MainWindow(QMainWindow):
         self.topn_spin = QSpinBox()
         self.topn_spin.setRange(0, 1000)
         self.topn_spin.setValue(0)
+        self.topn_spin.setKeyboardTracking(False)
         form.addRow("Top N", self.topn_spin)
 
         self.bin_spin = QSpinBox()
         self.bin_spin.setRange(5, 200)
         self.bin_spin.setValue(30)
+        self.bin_spin.setKeyboardTracking(False)
         form.addRow("直方圖 bins", self.bin_spin)
 
         self.title_input = QLineEdit()
@@ -469,10 +972,12 @@ class MainWindow(QMainWindow):
         self.metric_hint = QLabel("勾選多個數值欄位，會把欄位名稱當成 X，比較其彙總值。")
         self.metric_hint.setWordWrap(True)
         metric_layout.addWidget(self.metric_hint)
-        self.metric_list = QListWidget()
+        self.metric_model = CheckListModel()
+        self.metric_model.checked_changed.connect(self.schedule_preview_refresh)
+        self.metric_list = QListView()
         self.metric_list.setSpacing(2)
         self.metric_list.setMinimumHeight(120)
-        self.metric_list.itemChanged.connect(self.schedule_preview_refresh)
+        self.metric_list.setModel(self.metric_model)
         metric_layout.addWidget(self.metric_list)
         self.metric_group.setVisible(False)
         layout.addWidget(self.metric_group)
@@ -499,7 +1004,7 @@ class MainWindow(QMainWindow):
         self.agg_combo.currentTextChanged.connect(on_builder_change)
         self.topn_spin.valueChanged.connect(on_builder_change)
         self.bin_spin.valueChanged.connect(on_builder_change)
-        self.title_input.textChanged.connect(self.schedule_preview_refresh)
+        self.title_input.textChanged.connect(self.on_title_changed)
 
         return group
 
@@ -514,9 +1019,14 @@ class MainWindow(QMainWindow):
         self.pivot_rows_list = QListWidget()
         self.pivot_cols_list = QListWidget()
         self.pivot_vals_list = QListWidget()
-        for lst in (self.pivot_rows_list, self.pivot_cols_list, self.pivot_vals_list):
+        for key, lst in (
+            ("rows", self.pivot_rows_list),
+            ("cols", self.pivot_cols_list),
+            ("vals", self.pivot_vals_list),
+        ):
             lst.setSpacing(2)
             lst.setMinimumHeight(100)
+            lst.itemChanged.connect(lambda item, k=key: self.on_pivot_item_changed(k, item))
 
         layout.addWidget(QLabel("列（Rows）"))
         layout.addWidget(self.pivot_rows_list)
@@ -597,7 +1107,8 @@ class MainWindow(QMainWindow):
         self.preview_message.setWordWrap(True)
         preview_layout.addWidget(self.preview_message)
 
-        self.preview_chart_view = QChartView()
+        self.preview_chart = QChart()
+        self.preview_chart_view = QChartView(self.preview_chart)
         self.preview_chart_view.setRenderHint(QPainter.Antialiasing)
         self.preview_chart_view.setMinimumHeight(320)
         preview_layout.addWidget(self.preview_chart_view)
@@ -617,7 +1128,8 @@ class MainWindow(QMainWindow):
         self.pivot_message.setWordWrap(True)
         pivot_layout.addWidget(self.pivot_message)
 
-        self.pivot_chart_view = QChartView()
+        self.pivot_chart = QChart()
+        self.pivot_chart_view = QChartView(self.pivot_chart)
         self.pivot_chart_view.setRenderHint(QPainter.Antialiasing)
         self.pivot_chart_view.setMinimumHeight(280)
         pivot_layout.addWidget(self.pivot_chart_view)
@@ -656,10 +1168,15 @@ class MainWindow(QMainWindow):
         self.auto_load_checkbox.setChecked(bool(cfg.get("auto_load_on_start", False)))
 
         if cfg.get("auto_load_on_start") and cfg.get("source_path"):
-            loaded = self.load_from_path(show_message=False)
-            if loaded:
+            if self.load_from_path(show_message=False, on_done=self._after_initial_load):
                 return
+        self._load_latest_quietly()
 
+    def _after_initial_load(self, loaded: bool) -> None:
+        if not loaded:
+            self._load_latest_quietly()
+
+    def _load_latest_quietly(self) -> None:
         df = load_latest_df()
         if df is not None:
             self.set_data(df)
@@ -684,18 +1201,18 @@ class MainWindow(QMainWindow):
             return raw_path
 
         fmt = self.date_format_input.text().strip() or "%m%d"
-        today_str = datetime.now().strftime(fmt)
+        now = datetime.now()
+        today_str = now.strftime(fmt)
 
         if "{date" in raw_path:
             def replace(match: re.Match[str]) -> str:
                 fmt_override = match.group(1) or fmt
-                return datetime.now().strftime(fmt_override)
+                return now.strftime(fmt_override)
 
-            return re.sub(r"\{date(?::([^}]+))?\}", replace, raw_path)
+            return DATE_TOKEN_RE.sub(replace, raw_path)
 
         name = Path(raw_path).name
-        pattern = rf"(\\d{{{len(today_str)}}})(?!.*\\d)"
-        new_name = re.sub(pattern, today_str, name, count=1)
+        new_name = trailing_digits_re(len(today_str)).sub(today_str, name, count=1)
         if new_name != name:
             return str(Path(raw_path).with_name(new_name))
         return raw_path
@@ -707,7 +1224,13 @@ class MainWindow(QMainWindow):
         self.filter_dialog.raise_()
         self.filter_dialog.activateWindow()
 
-    def load_from_path(self, show_message: bool = True) -> bool:
+    def load_from_path(
+        self,
+        show_message: bool = True,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ) -> bool:
+        if self._pending_load is not None:
+            return False
         raw_path = self.path_input.text().strip()
         path = self.resolve_source_path(raw_path)
         if not path:
@@ -724,18 +1247,31 @@ class MainWindow(QMainWindow):
         cfg["auto_load_on_start"] = self.auto_load_checkbox.isChecked()
         save_config(cfg)
 
-        df, err = safe_update(path, cfg["encoding"], "manual")
+        self._pending_load = (path, show_message, on_done)
+        self.load_button.setEnabled(False)
+        self.upload_button.setEnabled(False)
+        self.source_status.setText(f"讀取中: {path}")
+        QThreadPool.globalInstance().start(LoadTask(path, cfg["encoding"], self._load_signals))
+        return True
+
+    def _on_load_finished(self, df: Optional[pd.DataFrame], err: Optional[str]) -> None:
+        path, show_message, on_done = self._pending_load
+        self._pending_load = None
+        self.load_button.setEnabled(True)
+        self.upload_button.setEnabled(True)
+        loaded = False
         if err:
             if show_message:
                 QMessageBox.critical(self, "更新失敗", err)
-            return False
-        if df is None:
+        elif df is None:
             if show_message:
                 QMessageBox.critical(self, "更新失敗", "讀取失敗")
-            return False
-        self.set_data(df)
-        self.source_status.setText(f"已更新: {path}")
-        return True
+        else:
+            self.set_data(df)
+            loaded = True
+        self.source_status.setText(f"已更新: {path}" if loaded else f"更新失敗: {path}")
+        if on_done is not None:
+            on_done(loaded)
 
     def load_latest(self) -> None:
         df = load_latest_df()
@@ -746,88 +1282,102 @@ class MainWindow(QMainWindow):
         self.source_status.setText("已載入 data/latest.csv")
 
     def set_data(self, df: pd.DataFrame) -> None:
-        self.df = df.copy()
-        self.filtered_df = df.copy()
+        # Filter controls hold widgets built from the previous frame; rebuild them against the new one.
+        filter_state = self.get_filter_state() if self.filter_controls else None
+        df = columnar_frame(with_arrow_strings(df))
+        self.df = df
+        self.filtered_df = df
+        self.filter_mask = None
         self.parsed_dates = {}
+        self.filter_sources = {}
+        self.date_lookups = {}
+        self.all_cols = list(df.columns)
+        self.numeric_cols = [col for col, dtype in df.dtypes.items() if pd.api.types.is_numeric_dtype(dtype)]
+        self.column_series = {col: df[col] for col in self.all_cols}
 
-        model = DataFrameModel(self.filtered_df.head(1000))
+        model = DataFrameModel(self.filtered_df, row_cap=PREVIEW_ROW_CAP)
         self.preview_table.setModel(model)
 
         self._refresh_column_lists()
         self.update_builder_options()
         self.refresh_pivot_lists()
-        self.apply_filters()
+        if filter_state is not None:
+            self.apply_filter_state(filter_state)
+        else:
+            self._show_filtered(df)
 
     def _refresh_column_lists(self) -> None:
-        self.filter_column_list.blockSignals(True)
-        self.filter_column_list.clear()
-        if self.df is not None:
-            for col in self.df.columns:
-                item = QListWidgetItem(col)
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(Qt.Unchecked)
-                desc = self.column_meta.get(col, "")
-                item.setToolTip(desc or "尚未設定欄位說明")
-                self.filter_column_list.addItem(item)
-        self.filter_column_list.blockSignals(False)
+        tooltips = [self.column_meta.get(col, "") or "尚未設定欄位說明" for col in self.all_cols]
+        self.filter_column_model.reset(self.all_cols, set(), tooltips)
+        self.filter_col_lower = [col.lower() for col in self.all_cols]
 
     def filter_column_items(self) -> None:
         keyword = self.filter_search.text().strip().lower()
-        for i in range(self.filter_column_list.count()):
-            item = self.filter_column_list.item(i)
-            text = item.text().lower()
-            item.setHidden(bool(keyword) and keyword not in text)
+        for i, text in enumerate(self.filter_col_lower):
+            self.filter_column_list.setRowHidden(i, bool(keyword) and keyword not in text)
 
     def configure_table_view(self, table: QTableView) -> None:
         table.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         header = table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setDefaultSectionSize(110)
         header.setStretchLastSection(False)
+        rows = table.verticalHeader()
+        rows.setSectionResizeMode(QHeaderView.Fixed)
+        rows.setDefaultSectionSize(table.fontMetrics().height() + 8)
+        table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
         table.setWordWrap(False)
         table.setTextElideMode(Qt.ElideRight)
 
     def refresh_pivot_lists(self) -> None:
         if self.df is None:
             return
-        all_cols = list(self.df.columns)
-        numeric_cols = [col for col in all_cols if pd.api.types.is_numeric_dtype(self.df[col])]
+        all_cols = self.all_cols
+        numeric_cols = self.numeric_cols
 
-        def refill(widget: QListWidget, options: List[str]) -> None:
-            previous = set()
-            for idx in range(widget.count()):
-                item = widget.item(idx)
-                if item.checkState() == Qt.Checked:
-                    previous.add(item.text())
-            widget.blockSignals(True)
-            widget.clear()
-            for col in options:
-                item = QListWidgetItem(col)
-                item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                item.setCheckState(Qt.Checked if col in previous else Qt.Unchecked)
-                widget.addItem(item)
-            widget.blockSignals(False)
-
-        refill(self.pivot_rows_list, all_cols)
-        refill(self.pivot_cols_list, all_cols)
-        refill(self.pivot_vals_list, numeric_cols)
-
-    def get_checked_items(self, widget: QListWidget) -> List[str]:
-        values: List[str] = []
-        for idx in range(widget.count()):
-            item = widget.item(idx)
-            if item.checkState() == Qt.Checked:
-                values.append(item.text())
-        return values
+        def refill(widget: QListWidget, key: str, options: List[str]) -> None:
+            previous = self.pivot_checked[key] & set(options)
+            self.pivot_checked[key] = previous
+            fill_check_list(widget, options, previous)
+
+        refill(self.pivot_rows_list, "rows", all_cols)
+        refill(self.pivot_cols_list, "cols", all_cols)
+        refill(self.pivot_vals_list, "vals", numeric_cols)
+
+    def on_pivot_item_changed(self, key: str, item: QListWidgetItem) -> None:
+        if item.checkState() == Qt.Checked:
+            self.pivot_checked[key].add(item.text())
+        else:
+            self.pivot_checked[key].discard(item.text())
+
+    def get_checked_items(self, key: str) -> List[str]:
+        checked = self.pivot_checked[key]
+        if not checked:
+            return []
+        return [col for col in self.all_cols if col in checked]
 
     def get_pivot_selection(self) -> Tuple[List[str], List[str], List[str], str, bool]:
-        rows = self.get_checked_items(self.pivot_rows_list)
-        cols = self.get_checked_items(self.pivot_cols_list)
-        vals = self.get_checked_items(self.pivot_vals_list)
+        rows = self.get_checked_items("rows")
+        cols = self.get_checked_items("cols")
+        vals = self.get_checked_items("vals")
         agg = self.pivot_agg_combo.currentText()
         values_in_columns = self.pivot_values_in_columns.isChecked()
         return rows, cols, vals, agg, values_in_columns
 
+    def filtered_pivot(
+        self,
+        rows: List[str],
+        cols: List[str],
+        vals: List[str],
+        agg: str,
+        values_in_columns: bool,
+    ) -> Tuple[pd.DataFrame, Union[pd.DataFrame, pd.Series]]:
+        key = (tuple(rows), tuple(cols), tuple(vals), agg, values_in_columns)
+        if key not in self.pivot_cache:
+            self.pivot_cache[key] = self.compute_pivot(self.filtered_df, rows, cols, vals, agg, values_in_columns)
+        return self.pivot_cache[key]
+
     def compute_pivot(
         self,
         df: pd.DataFrame,
@@ -837,7 +1387,15 @@ class MainWindow(QMainWindow):
         agg: str,
         values_in_columns: bool,
     ) -> Tuple[pd.DataFrame, Union[pd.DataFrame, pd.Series]]:
-        if vals:
+        df = as_categorical_keys(df, rows + cols)
+        # groupby rejects a key listed twice, so a field in both rows and columns goes through pivot_table.
+        shared_keys = set(rows) & set(cols)
+        if vals and rows and agg in FAST_PIVOT_AGGS and not set(vals) & set(rows + cols) and not shared_keys:
+            grouped = df.groupby(rows + cols, observed=True, dropna=False)[vals].agg(agg)
+            if cols:
+                grouped = grouped.unstack(cols, fill_value=0)
+            pivot = key_product(grouped).sort_index(axis=1).fillna(0)
+        elif vals:
             pivot = pd.pivot_table(
                 df,
                 index=rows or None,
@@ -845,17 +1403,24 @@ class MainWindow(QMainWindow):
                 values=vals,
                 aggfunc=agg,
                 fill_value=0,
+                observed=True,
                 dropna=False,
             )
-        else:
+        elif shared_keys:
             pivot = pd.pivot_table(
                 df,
-                index=rows or None,
-                columns=cols or None,
+                index=rows,
+                columns=cols,
                 aggfunc="size",
                 fill_value=0,
+                observed=True,
                 dropna=False,
             )
+        else:
+            pivot = df.groupby(rows + cols, observed=True, dropna=False).size()
+            if rows and cols:
+                pivot = pivot.unstack(cols, fill_value=0)
+            pivot = key_product(pivot)
 
         if vals and (not values_in_columns) and len(vals) > 1:
             if isinstance(pivot, pd.DataFrame):
@@ -863,13 +1428,11 @@ class MainWindow(QMainWindow):
             elif isinstance(pivot, pd.Series):
                 pivot = pivot.to_frame(name="value").stack(0)
 
-        pivot_df = pivot.copy()
+        pivot_df = pivot.copy(deep=False)
         if isinstance(pivot_df, pd.Series):
             pivot_df = pivot_df.to_frame(name="value")
         if isinstance(pivot_df.columns, pd.MultiIndex):
-            pivot_df.columns = [
-                " / ".join([str(c) for c in col if c != ""]) for col in pivot_df.columns
-            ]
+            pivot_df.columns = flatten_column_labels(pivot_df.columns)
         pivot_df = pivot_df.reset_index()
         return pivot_df, pivot
 
@@ -890,34 +1453,33 @@ class MainWindow(QMainWindow):
             self.column_meta.pop(col, None)
         save_column_meta(self.column_meta)
         label.setText(text or "（尚未設定欄位說明）")
-        for i in range(self.filter_column_list.count()):
-            item = self.filter_column_list.item(i)
-            if item.text() == col:
-                item.setToolTip(text or "尚未設定欄位說明")
-                break
+        self.filter_column_model.set_tooltip(col, text or "尚未設定欄位說明")
+
+    def _new_filter_container(self) -> Tuple[QWidget, QVBoxLayout]:
+        container = QWidget()
+        container.setStyleSheet(FILTER_GROUP_STYLE)
+        container_layout = QVBoxLayout(container)
+        container_layout.setSpacing(20)
+        container_layout.setContentsMargins(6, 6, 6, 6)
+        return container, container_layout
 
     def rebuild_filter_widgets(self) -> None:
         self.filter_controls = {}
-        while self.filter_area_layout.count() > 1:
-            child = self.filter_area_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        if self.df is None:
-            return
-
-        for idx in range(self.filter_column_list.count()):
-            item = self.filter_column_list.item(idx)
-            if item.checkState() != Qt.Checked:
-                continue
-            col = item.text()
-            series = self.df[col]
-
+        container, container_layout = self._new_filter_container()
+        self.filter_area.setUpdatesEnabled(False)
+        try:
+            if self.df is not None:
+                self._build_filter_groups(container_layout)
+            container_layout.addStretch(1)
+            self.filter_area.setWidget(container)
+            self.filter_area_widget, self.filter_area_layout = container, container_layout
+        finally:
+            self.filter_area.setUpdatesEnabled(True)
+            self.filter_area.update()
+
+    def _build_filter_groups(self, container_layout: QVBoxLayout) -> None:
+        for col in self.filter_column_model.checked_labels():
             group = QGroupBox(col)
-            group.setStyleSheet(
-                "QGroupBox { margin-top: 12px; }"
-                "QGroupBox::title { subcontrol-origin: margin; left: 8px; padding: 0 4px; }"
-            )
             group_layout = QVBoxLayout(group)
             group_layout.setContentsMargins(12, 24, 12, 12)
             group_layout.setSpacing(10)
@@ -925,7 +1487,7 @@ class MainWindow(QMainWindow):
             desc = self.column_meta.get(col, "")
             desc_label = QLabel(desc or "（尚未設定欄位說明）")
             desc_label.setWordWrap(True)
-            desc_label.setStyleSheet("color: #b5b5b5; font-size: 12px;")
+            desc_label.setObjectName("filterDescription")
             group_layout.addWidget(desc_label)
 
             edit_btn = QPushButton("編輯欄位說明")
@@ -933,9 +1495,9 @@ class MainWindow(QMainWindow):
             edit_btn.clicked.connect(lambda _, c=col, lbl=desc_label: self.edit_column_description(c, lbl))
             group_layout.addWidget(edit_btn)
 
-            if pd.api.types.is_numeric_dtype(series):
-                min_val = float(series.min()) if series.notna().any() else 0.0
-                max_val = float(series.max()) if series.notna().any() else 0.0
+            source = self.filter_source(col)
+            if source["type"] == "numeric":
+                min_val, max_val = source["range"]
 
                 min_spin = QDoubleSpinBox()
                 min_spin.setRange(-1e18, 1e18)
@@ -951,101 +1513,92 @@ class MainWindow(QMainWindow):
                 form.addRow("最大值", max_spin)
                 group_layout.addLayout(form)
 
-                self.filter_controls[col] = {
-                    "type": "numeric",
-                    "min": min_spin,
-                    "max": max_spin,
-                }
+                self.filter_controls[col] = {"type": "numeric", "min": min_spin, "max": max_spin}
+            elif source["type"] == "datetime":
+                min_date = source["min"]
+                max_date = source["max"]
+
+                start_edit = QDateEdit()
+                start_edit.setCalendarPopup(True)
+                end_edit = QDateEdit()
+                end_edit.setCalendarPopup(True)
+                start_edit.setMinimumHeight(28)
+                end_edit.setMinimumHeight(28)
+
+                if pd.notna(min_date):
+                    start_edit.setDate(QDate(min_date.year, min_date.month, min_date.day))
+                if pd.notna(max_date):
+                    end_edit.setDate(QDate(max_date.year, max_date.month, max_date.day))
+
+                form = QFormLayout()
+                form.addRow("起始", start_edit)
+                form.addRow("結束", end_edit)
+                group_layout.addLayout(form)
+
+                self.filter_controls[col] = {"type": "datetime", "start": start_edit, "end": end_edit}
             else:
-                parsed = self._try_parse_datetime(series)
-                if parsed is not None:
-                    min_date = parsed.min()
-                    max_date = parsed.max()
-
-                    start_edit = QDateEdit()
-                    start_edit.setCalendarPopup(True)
-                    end_edit = QDateEdit()
-                    end_edit.setCalendarPopup(True)
-                    start_edit.setMinimumHeight(28)
-                    end_edit.setMinimumHeight(28)
-
-                    if pd.notna(min_date):
-                        start_edit.setDate(QDate(min_date.year, min_date.month, min_date.day))
-                    if pd.notna(max_date):
-                        end_edit.setDate(QDate(max_date.year, max_date.month, max_date.day))
-
-                    form = QFormLayout()
-                    form.addRow("起始", start_edit)
-                    form.addRow("結束", end_edit)
-                    group_layout.addLayout(form)
-
-                    self.filter_controls[col] = {
-                        "type": "datetime",
-                        "start": start_edit,
-                        "end": end_edit,
-                        "series": parsed,
-                    }
-                else:
-                    values = series.dropna().unique().tolist()
-                    if len(values) > 2000:
-                        values = pd.Series(values).value_counts().head(2000).index.tolist()
-                        group_layout.addWidget(QLabel("只顯示前 2000 個值"))
-
-                    list_widget = QListWidget()
-                    list_widget.setSpacing(2)
-                    for value in sorted(values, key=lambda x: str(x)):
-                        item = QListWidgetItem(str(value))
-                        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-                        item.setCheckState(Qt.Checked)
-                        item.setData(Qt.UserRole, value)
-                        list_widget.addItem(item)
-                    list_widget.setMinimumHeight(200)
-                    group_layout.addWidget(list_widget)
-
-                    self.filter_controls[col] = {
-                        "type": "categorical",
-                        "widget": list_widget,
-                    }
-
-            self.filter_area_layout.insertWidget(self.filter_area_layout.count() - 1, group)
+                if source["truncated"]:
+                    group_layout.addWidget(QLabel("只顯示前 2000 個值"))
+                model = CheckListModel(source["labels"], source["values"])
+                list_view = QListView()
+                list_view.setSpacing(2)
+                list_view.setUniformItemSizes(True)
+                list_view.setModel(model)
+                list_view.setMinimumHeight(200)
+                group_layout.addWidget(list_view)
+
+                self.filter_controls[col] = {"type": "categorical", "model": model}
+
+            container_layout.addWidget(group)
 
     def apply_filters(self) -> None:
         if self.df is None:
             return
-        df = self.df.copy()
+        ranges: List[Tuple[np.ndarray, float, float]] = []
+        sorted_dates: List[Tuple[np.ndarray, int, int]] = []
         for col, ctrl in self.filter_controls.items():
             if ctrl["type"] == "numeric":
-                min_val = ctrl["min"].value()
-                max_val = ctrl["max"].value()
-                df = df[df[col].between(min_val, max_val)]
+                ranges.append((self.filter_source(col)["values"], ctrl["min"].value(), ctrl["max"].value()))
             elif ctrl["type"] == "datetime":
-                series = ctrl["series"]
-                start_date = ctrl["start"].date().toPython()
-                end_date = ctrl["end"].date().toPython()
-                mask = (series.dt.date >= start_date) & (series.dt.date <= end_date)
-                df = df[mask]
-            elif ctrl["type"] == "categorical":
-                widget: QListWidget = ctrl["widget"]
-                selected = []
-                for i in range(widget.count()):
-                    item = widget.item(i)
-                    if item.checkState() == Qt.Checked:
-                        selected.append(item.data(Qt.UserRole))
-                if selected:
-                    df = df[df[col].isin(selected)]
+                source = self.filter_source(col)
+                low = day_epoch(ctrl["start"].date().toPython())
+                high = day_epoch(ctrl["end"].date().toPython() + timedelta(days=1)) - 1
+                (sorted_dates if source["sorted"] else ranges).append((source["epoch"], low, high))
+        mask = range_mask(ranges, len(self.df))
+        for epoch, low, high in sorted_dates:
+            mask[: np.searchsorted(epoch, low, side="left")] = False
+            mask[np.searchsorted(epoch, high, side="right") :] = False
+        for col, ctrl in self.filter_controls.items():
+            if ctrl["type"] == "categorical":
+                model: CheckListModel = ctrl["model"]
+                checked = model.checked_rows()
+                codes = self.filter_source(col)["codes"]
+                if not len(checked):
+                    mask[:] = False
                 else:
-                    df = df.iloc[0:0]
+                    allowed = np.zeros(model.rowCount() + 1, dtype=bool)
+                    allowed[checked] = True
+                    mask &= allowed[codes]
+        if self.filter_mask is not None and np.array_equal(mask, self.filter_mask):
+            return
+        self.filter_mask = mask
 
+        df = self.df if mask.all() else self.df[mask]
         self.filtered_df = df
+        model = self.preview_table.model()
+        if isinstance(model, DataFrameModel):
+            model.set_df(df)
+        self._show_filtered(df)
+
+    def _show_filtered(self, df: pd.DataFrame) -> None:
+        self.dashboard_generation += 1
+        self.histogram_cache = {}
+        self.pivot_cache = {}
+        self.aggregate_cache = {}
         self.filter_status.setText(f"篩選後筆數: {len(df):,}")
         if self.filter_summary_label is not None:
             self.filter_summary_label.setText(f"篩選後筆數: {len(df):,}")
-
-        model = self.preview_table.model()
-        if isinstance(model, DataFrameModel):
-            model.set_df(df.head(1000))
-
-        self.refresh_preview()
+        self.schedule_preview_refresh()
         self.refresh_dashboard()
 
     def reset_pivot(self) -> None:
@@ -1054,7 +1607,7 @@ class MainWindow(QMainWindow):
                 widget.item(idx).setCheckState(Qt.Unchecked)
         self.pivot_df = None
         self.pivot_message.setText("尚未套用樞紐")
-        self.pivot_chart_view.setChart(QChart())
+        adopt_chart(self.pivot_chart, None)
         self.pivot_table.setModel(DataFrameModel(pd.DataFrame()))
 
     def apply_pivot(self) -> None:
@@ -1066,21 +1619,19 @@ class MainWindow(QMainWindow):
             self.pivot_message.setText("請至少選擇「列」或「欄」")
             return
 
-        df = self.filtered_df.copy()
         try:
-            pivot_df, pivot = self.compute_pivot(df, rows, cols, vals, agg, values_in_columns)
+            pivot_df, pivot = self.filtered_pivot(rows, cols, vals, agg, values_in_columns)
             self.pivot_df = pivot_df
 
-            model = DataFrameModel(pivot_df)
+            model = DataFrameModel(pivot_df, row_cap=PREVIEW_ROW_CAP)
             self.pivot_table.setModel(model)
             self.pivot_message.setText(f"樞紐完成：{len(pivot_df):,} 列")
-            self.pivot_chart_view.setChart(
-                self.build_pivot_chart(pivot, rows, cols, self.pivot_chart_combo.currentText())
-            )
+            chart = self.build_pivot_chart(pivot, rows, cols, self.pivot_chart_combo.currentText())
+            adopt_chart(self.pivot_chart, chart)
             self.tabs.setCurrentIndex(1)
         except Exception as exc:
             self.pivot_message.setText(f"樞紐失敗: {exc}")
-            self.pivot_chart_view.setChart(QChart())
+            adopt_chart(self.pivot_chart, None)
 
     def add_pivot_to_dashboard(self) -> None:
         if self.filtered_df is None:
@@ -1090,7 +1641,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "樞紐", "請至少選擇「列」或「欄」")
             return
         try:
-            pivot_df, pivot = self.compute_pivot(self.filtered_df, rows, cols, vals, agg, values_in_columns)
+            pivot_df, pivot = self.filtered_pivot(rows, cols, vals, agg, values_in_columns)
         except Exception as exc:
             QMessageBox.critical(self, "樞紐", f"樞紐失敗: {exc}")
             return
@@ -1127,18 +1678,11 @@ class MainWindow(QMainWindow):
         self.tabs.setCurrentIndex(2)
 
     def reset_filters(self) -> None:
-        for i in range(self.filter_column_list.count()):
-            item = self.filter_column_list.item(i)
-            item.setCheckState(Qt.Unchecked)
-        self.rebuild_filter_widgets()
+        self.filter_column_model.set_checked_labels(set())
         self.apply_filters()
 
     def get_filter_state(self) -> Dict[str, Any]:
-        columns: List[str] = []
-        for i in range(self.filter_column_list.count()):
-            item = self.filter_column_list.item(i)
-            if item.checkState() == Qt.Checked:
-                columns.append(item.text())
+        columns = self.filter_column_model.checked_labels()
 
         values: Dict[str, Any] = {}
         for col, ctrl in self.filter_controls.items():
@@ -1157,12 +1701,9 @@ class MainWindow(QMainWindow):
                     "end": end.isoformat(),
                 }
             elif ctrl["type"] == "categorical":
-                widget: QListWidget = ctrl["widget"]
-                selected: List[Any] = []
-                for idx in range(widget.count()):
-                    item = widget.item(idx)
-                    if item.checkState() == Qt.Checked:
-                        selected.append(normalize_json_value(item.data(Qt.UserRole)))
+                model: CheckListModel = ctrl["model"]
+                options = model.values()
+                selected = [normalize_json_value(options[i]) for i in model.checked_rows()]
                 values[col] = {
                     "type": "categorical",
                     "selected": selected,
@@ -1173,12 +1714,7 @@ class MainWindow(QMainWindow):
     def apply_filter_state(self, state: Dict[str, Any]) -> None:
         if self.df is None:
             return
-        columns = set(state.get("columns", []))
-        for i in range(self.filter_column_list.count()):
-            item = self.filter_column_list.item(i)
-            item.setCheckState(Qt.Checked if item.text() in columns else Qt.Unchecked)
-
-        self.rebuild_filter_widgets()
+        self.filter_column_model.set_checked_labels(set(state.get("columns", [])))
 
         values = state.get("values", {})
         for col, cfg in values.items():
@@ -1201,11 +1737,9 @@ class MainWindow(QMainWindow):
             elif ctrl["type"] == "categorical" and cfg.get("type") == "categorical":
                 selected_raw = cfg.get("selected", [])
                 selected_set = {normalize_json_value(v) for v in selected_raw}
-                widget: QListWidget = ctrl["widget"]
-                for idx in range(widget.count()):
-                    item = widget.item(idx)
-                    value = normalize_json_value(item.data(Qt.UserRole))
-                    item.setCheckState(Qt.Checked if value in selected_set else Qt.Unchecked)
+                model: CheckListModel = ctrl["model"]
+                checked = [normalize_json_value(v) in selected_set for v in model.values()]
+                model.set_checked(np.array(checked, dtype=np.uint8))
 
         self.apply_filters()
 
@@ -1214,8 +1748,8 @@ class MainWindow(QMainWindow):
             return
 
         chart_type = self.chart_type_combo.currentText()
-        all_cols = list(self.df.columns)
-        numeric_cols = [col for col in all_cols if pd.api.types.is_numeric_dtype(self.df[col])]
+        all_cols = self.all_cols
+        numeric_cols = self.numeric_cols
 
         def set_combo(combo: QComboBox, options: List[str]) -> None:
             current = combo.currentText()
@@ -1260,14 +1794,7 @@ class MainWindow(QMainWindow):
 
     def refresh_metric_list(self, numeric_cols: List[str]) -> None:
         previous = set(self.get_metric_cols_from_ui())
-        self.metric_list.blockSignals(True)
-        self.metric_list.clear()
-        for col in numeric_cols:
-            item = QListWidgetItem(col)
-            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
-            item.setCheckState(Qt.Checked if col in previous else Qt.Unchecked)
-            self.metric_list.addItem(item)
-        self.metric_list.blockSignals(False)
+        self.metric_model.reset(numeric_cols, previous)
 
     def is_metric_mode(self) -> bool:
         return self.x_combo.currentText() == METRIC_X_LABEL
@@ -1298,13 +1825,16 @@ class MainWindow(QMainWindow):
             self.color_combo.setEnabled(True)
             self.size_combo.setEnabled(True)
 
-    def schedule_preview_refresh(self, delay_ms: int = 200) -> None:
-        if self._preview_timer.isActive():
-            self._preview_timer.stop()
-        self._preview_timer.start(delay_ms)
+    def schedule_preview_refresh(self, *_: Any) -> None:
+        self._preview_timer.start(PREVIEW_DEBOUNCE_MS)
+
+    def on_title_changed(self, text: str) -> None:
+        if self.filtered_df is not None and not self.preview_message.text():
+            self.preview_chart.setTitle(text.strip() or "Chart")
 
     def on_full_labels_toggled(self) -> None:
         self.schedule_preview_refresh()
+        self.dashboard_generation += 1
         self.refresh_dashboard()
         if self.pivot_df is not None:
             self.apply_pivot()
@@ -1331,7 +1861,7 @@ class MainWindow(QMainWindow):
         name = next_template_name(self.templates)
         template = {
             "name": name,
-            "charts": [asdict(cfg) for cfg in self.charts],
+            "charts": [cfg.to_dict() for cfg in self.charts],
             "filters": self.get_filter_state(),
         }
         self.templates.append(template)
@@ -1348,9 +1878,21 @@ class MainWindow(QMainWindow):
             if not self.path_input.text().strip():
                 QMessageBox.information(self, "模板", "請先設定資料路徑")
                 return
-            if not self.load_from_path(show_message=False):
-                QMessageBox.warning(self, "模板", "更新資料失敗，已取消套用模板")
+            if self._pending_load is not None:
+                QMessageBox.information(self, "模板", "資料讀取中，請稍後再套用模板")
                 return
+            if not self.load_from_path(show_message=False, on_done=lambda ok: self._after_template_load(name, ok)):
+                QMessageBox.warning(self, "模板", "更新資料失敗，已取消套用模板")
+            return
+        self._apply_template_named(name)
+
+    def _after_template_load(self, name: str, loaded: bool) -> None:
+        if not loaded:
+            QMessageBox.warning(self, "模板", "更新資料失敗，已取消套用模板")
+            return
+        self._apply_template_named(name)
+
+    def _apply_template_named(self, name: str) -> None:
         template = next((tpl for tpl in self.templates if tpl.get("name") == name), None)
         if not template:
             return
@@ -1413,12 +1955,7 @@ class MainWindow(QMainWindow):
         return cols
 
     def get_metric_cols_from_ui(self) -> List[str]:
-        cols: List[str] = []
-        for i in range(self.metric_list.count()):
-            item = self.metric_list.item(i)
-            if item.checkState() == Qt.Checked:
-                cols.append(item.text())
-        return cols
+        return self.metric_model.checked_labels()
 
     def current_config(self) -> ChartConfig:
         y_col = self.y_combo.currentText()
@@ -1464,85 +2001,98 @@ class MainWindow(QMainWindow):
             return
         cfg = self.current_config()
         chart, err = self.build_chart(self.filtered_df, cfg)
-        if err:
-            self.preview_message.setText(err)
-            self.preview_chart_view.setChart(QChart())
-        else:
-            self.preview_message.setText("")
-            self.preview_chart_view.setChart(chart)
+        self.preview_message.setText(err or "")
+        adopt_chart(self.preview_chart, None if err else chart)
 
     def refresh_dashboard(self) -> None:
-        for i in reversed(range(self.dashboard_grid.count() - 1)):
-            item = self.dashboard_grid.takeAt(i)
-            if item.widget():
-                item.widget().deleteLater()
-
-        if self.filtered_df is None:
-            return
-
-        if not self.charts:
-            empty_label = QLabel("尚未加入圖表")
-            self.dashboard_grid.insertWidget(0, empty_label)
-            return
-
-        for idx, cfg in enumerate(self.charts):
-            frame = QFrame()
-            frame.setFrameShape(QFrame.StyledPanel)
-            frame_layout = QVBoxLayout(frame)
-            title = QLabel(cfg.title)
-            title.setStyleSheet("font-weight: bold")
-            frame_layout.addWidget(title)
-
-            if cfg.chart_type == "Pivot":
-                rows = cfg.pivot_rows or []
-                cols = cfg.pivot_cols or []
-                vals = cfg.pivot_vals or []
-                agg = cfg.pivot_agg or "sum"
-                values_in_columns = True if cfg.pivot_values_in_columns is None else cfg.pivot_values_in_columns
-                try:
-                    pivot_df, pivot_raw = self.compute_pivot(
-                        self.filtered_df,
+        self._dashboard_timer.start(DASHBOARD_DEBOUNCE_MS)
+
+    def _refresh_dashboard_now(self) -> None:
+        reusable: Dict[Tuple[bytes, int], List[QFrame]] = {}
+        for key, frame in zip(self.dashboard_keys, self.dashboard_frames):
+            reusable.setdefault(key, []).append(frame)
+        taken: List[QWidget] = []
+        while self.dashboard_grid.count() > 1:
+            widget = self.dashboard_grid.takeAt(0).widget()
+            if widget is not None:
+                taken.append(widget)
+
+        keys: List[Tuple[bytes, int]] = []
+        frames: List[QFrame] = []
+        if self.filtered_df is not None:
+            if not self.charts:
+                self.dashboard_grid.insertWidget(0, QLabel("尚未加入圖表"))
+            for idx, cfg in enumerate(self.charts):
+                key = (chart_key(cfg), self.dashboard_generation)
+                pool = reusable.get(key)
+                frame = pool.pop(0) if pool else self._build_dashboard_frame(cfg)
+                keys.append(key)
+                frames.append(frame)
+                self.dashboard_grid.insertWidget(idx, frame)
+
+        for widget in taken:
+            if not any(widget is frame for frame in frames):
+                widget.deleteLater()
+        self.dashboard_keys = keys
+        self.dashboard_frames = frames
+
+    def _build_dashboard_frame(self, cfg: ChartConfig) -> QFrame:
+        frame = QFrame()
+        frame.setFrameShape(QFrame.StyledPanel)
+        frame_layout = QVBoxLayout(frame)
+        title = QLabel(cfg.title)
+        title.setStyleSheet("font-weight: bold")
+        frame_layout.addWidget(title)
+
+        if cfg.chart_type == "Pivot":
+            rows = cfg.pivot_rows or []
+            cols = cfg.pivot_cols or []
+            vals = cfg.pivot_vals or []
+            agg = cfg.pivot_agg or "sum"
+            values_in_columns = True if cfg.pivot_values_in_columns is None else cfg.pivot_values_in_columns
+            try:
+                pivot_df, pivot_raw = self.filtered_pivot(rows, cols, vals, agg, values_in_columns)
+                view = QChartView(
+                    self.build_pivot_chart(
+                        pivot_raw,
                         rows,
                         cols,
-                        vals,
-                        agg,
-                        values_in_columns,
+                        cfg.pivot_chart_type or "長條",
                     )
-                    view = QChartView(
-                        self.build_pivot_chart(
-                            pivot_raw,
-                            rows,
-                            cols,
-                            cfg.pivot_chart_type or "長條",
-                        )
-                    )
-                    view.setMinimumHeight(240)
-                    view.setRenderHint(QPainter.Antialiasing)
-                    frame_layout.addWidget(view)
-
-                    table = QTableView()
-                    table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-                    self.configure_table_view(table)
-                    table.setModel(DataFrameModel(pivot_df.head(1000)))
-                    table.setMinimumHeight(220)
-                    frame_layout.addWidget(table)
-                except Exception as exc:
-                    frame_layout.addWidget(QLabel(f"樞紐失敗: {exc}"))
+                )
+                view.setMinimumHeight(240)
+                view.setRenderHint(QPainter.Antialiasing)
+                frame_layout.addWidget(view)
+
+                table = QTableView()
+                table.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+                self.configure_table_view(table)
+                table.setModel(DataFrameModel(pivot_df, row_cap=PREVIEW_ROW_CAP))
+                table.setMinimumHeight(220)
+                frame_layout.addWidget(table)
+            except Exception as exc:
+                frame_layout.addWidget(QLabel(f"樞紐失敗: {exc}"))
+        else:
+            chart, err = self.build_chart(self.filtered_df, cfg)
+            if err:
+                frame_layout.addWidget(QLabel(err))
             else:
-                chart, err = self.build_chart(self.filtered_df, cfg)
-                if err:
-                    frame_layout.addWidget(QLabel(err))
-                else:
-                    view = QChartView(chart)
-                    view.setMinimumHeight(240)
-                    view.setRenderHint(QPainter.Antialiasing)
-                    frame_layout.addWidget(view)
-
-            remove_btn = QPushButton("移除圖表")
-            remove_btn.clicked.connect(lambda _, i=idx: self.remove_chart(i))
-            frame_layout.addWidget(remove_btn)
-
-            self.dashboard_grid.insertWidget(idx, frame)
+                view = QChartView(chart)
+                view.setMinimumHeight(240)
+                view.setRenderHint(QPainter.Antialiasing)
+                frame_layout.addWidget(view)
+
+        remove_btn = QPushButton("移除圖表")
+        remove_btn.clicked.connect(lambda _, f=frame: self.remove_chart_frame(f))
+        frame_layout.addWidget(remove_btn)
+        return frame
+
+    def remove_chart_frame(self, frame: QFrame) -> None:
+        if self._dashboard_timer.isActive():
+            self._dashboard_timer.stop()
+            self._refresh_dashboard_now()
+        if frame in self.dashboard_frames:
+            self.remove_chart(self.dashboard_frames.index(frame))
 
     def remove_chart(self, idx: int) -> None:
         if 0 <= idx < len(self.charts):
@@ -1574,31 +2124,17 @@ class MainWindow(QMainWindow):
                 if not metric_cols:
                     return None, "請勾選度量欄位"
                 agg = cfg.agg if cfg.agg != "none" else "sum"
-                values: List[float] = []
-                for col in metric_cols:
-                    series = df[col].dropna()
-                    if agg == "count":
-                        values.append(float(series.count()))
-                    elif agg == "mean":
-                        values.append(float(series.mean()) if not series.empty else 0.0)
-                    elif agg == "median":
-                        values.append(float(series.median()) if not series.empty else 0.0)
-                    elif agg == "min":
-                        values.append(float(series.min()) if not series.empty else 0.0)
-                    elif agg == "max":
-                        values.append(float(series.max()) if not series.empty else 0.0)
-                    else:
-                        values.append(float(series.sum()) if not series.empty else 0.0)
+                values = metric_aggregates(df, metric_cols, agg)
 
                 data = pd.DataFrame({"metric": metric_cols, "value": values})
                 if cfg.top_n:
-                    data = data.sort_values("value", ascending=False).head(cfg.top_n)
+                    data = top_rows(data, "value", cfg.top_n)
                 categories = data["metric"].astype(str).tolist()
                 chart = QChart()
                 chart.setMargins(QMargins(10, 10, 10, 30))
                 if chart_type == "Bar":
                     bar_set = QBarSet(agg)
-                    bar_set.append([float(v) for v in data["value"].tolist()])
+                    bar_set.append(data["value"].tolist())
                     series = QBarSeries()
                     series.append(bar_set)
                     chart.addSeries(series)
@@ -1608,15 +2144,14 @@ class MainWindow(QMainWindow):
                     chart.addAxis(axis_x, Qt.AlignBottom)
                     series.attachAxis(axis_x)
                     axis_y = QValueAxis()
-                    if not data["value"].empty:
-                        y_max = float(data["value"].max())
-                        axis_y.setRange(0, max(y_max * 1.1, 1))
+                    y_range = value_range(data["value"])
+                    if y_range:
+                        axis_y.setRange(0, max(y_range[1] * 1.1, 1))
                     chart.addAxis(axis_y, Qt.AlignLeft)
                     series.attachAxis(axis_y)
                 else:
                     series = QLineSeries()
-                    for idx, value in enumerate(data["value"].tolist()):
-                        series.append(float(idx), float(value))
+                    replace_points(series, np.arange(len(data)), data["value"].to_numpy())
                     chart.addSeries(series)
                     axis_x = QBarCategoryAxis()
                     axis_x.append(categories)
@@ -1624,9 +2159,9 @@ class MainWindow(QMainWindow):
                     chart.addAxis(axis_x, Qt.AlignBottom)
                     series.attachAxis(axis_x)
                     axis_y = QValueAxis()
-                    if not data["value"].empty:
-                        y_min = float(data["value"].min())
-                        y_max = float(data["value"].max())
+                    y_range = value_range(data["value"])
+                    if y_range:
+                        y_min, y_max = y_range
                         if y_min == y_max:
                             axis_y.setRange(y_min - 1, y_max + 1)
                         else:
@@ -1642,12 +2177,11 @@ class MainWindow(QMainWindow):
                     return None, "請選擇欄位"
                 if not pd.api.types.is_numeric_dtype(df[x_col]):
                     return None, "直方圖需要數值欄位"
-                data = df[x_col].dropna().values
-                counts, edges = np.histogram(data, bins=cfg.bins)
+                counts, edges = self.histogram_for(df, x_col, cfg.bins)
 
                 categories = [f"{edges[i]:.2f}-{edges[i+1]:.2f}" for i in range(len(counts))]
                 bar_set = QBarSet(x_col)
-                bar_set.append(list(counts))
+                bar_set.append(counts.tolist())
                 series = QBarSeries()
                 series.append(bar_set)
 
@@ -1665,8 +2199,7 @@ class MainWindow(QMainWindow):
                 series.attachAxis(axis_y)
                 if chart_type == "Histogram+Line":
                     line = QLineSeries()
-                    for idx, value in enumerate(counts):
-                        line.append(float(idx), float(value))
+                    replace_points(line, np.arange(len(counts)), counts)
                     chart.addSeries(line)
                     line.attachAxis(axis_x)
                     line.attachAxis(axis_y)
@@ -1684,41 +2217,36 @@ class MainWindow(QMainWindow):
 
                 chart = QChart()
                 chart.setMargins(QMargins(10, 10, 10, 30))
-                groups = [None]
+                xs = numeric_values(df[x_col]).astype(np.float64)
+                ys = numeric_values(df[y_col]).astype(np.float64)
+                valid = ~(np.isnan(xs) | np.isnan(ys))
                 if color_col:
-                    groups = df[color_col].dropna().unique().tolist()
-                max_points = 8000
-                max_per_group = max(500, int(max_points / max(len(groups), 1)))
+                    codes, uniques = pd.factorize(df[color_col])
+                    groups = uniques.tolist()
+                    rows = np.flatnonzero(valid & (codes >= 0))
+                    group_rows = split_groups(rows, codes[rows], len(groups))
+                else:
+                    groups = [None]
+                    group_rows = [np.flatnonzero(valid)]
+                max_per_group = max(500, int(SCATTER_MAX_POINTS / max(len(groups), 1)))
 
-                for group in groups:
+                for group, rows in zip(groups, group_rows):
                     series = QScatterSeries()
                     name = "全部" if group is None else str(group)
                     series.setName(name)
-                    subset = df if group is None else df[df[color_col] == group]
-                    subset = subset[[x_col, y_col]].dropna()
-                    if len(subset) > max_per_group:
-                        subset = subset.sample(n=max_per_group, random_state=42)
-                    if x_col == y_col:
-                        for value in subset[x_col].values.tolist():
-                            series.append(float(value), float(value))
-                    else:
-                        for _, row in subset.iterrows():
-                            x_val = row[x_col]
-                            y_val = row[y_col]
-                            if isinstance(x_val, pd.Series):
-                                x_val = x_val.iloc[0]
-                            if isinstance(y_val, pd.Series):
-                                y_val = y_val.iloc[0]
-                            series.append(float(x_val), float(y_val))
+                    if len(rows) > max_per_group:
+                        rows = rows[np.random.RandomState(42).choice(len(rows), max_per_group, replace=False)]
+                    replace_points(series, xs[rows], ys[rows])
+                    series.setUseOpenGL(use_opengl(len(rows)))
                     chart.addSeries(series)
 
                 axis_x = QValueAxis()
                 axis_y = QValueAxis()
-                x_vals = df[x_col].dropna()
-                y_vals = df[y_col].dropna()
-                if not x_vals.empty and not y_vals.empty:
-                    axis_x.setRange(float(x_vals.min()), float(x_vals.max()))
-                    axis_y.setRange(float(y_vals.min()), float(y_vals.max()))
+                x_range = array_range(xs)
+                y_range = array_range(ys)
+                if x_range and y_range:
+                    axis_x.setRange(*x_range)
+                    axis_y.setRange(*y_range)
                 chart.addAxis(axis_x, Qt.AlignBottom)
                 chart.addAxis(axis_y, Qt.AlignLeft)
                 for s in chart.series():
@@ -1735,8 +2263,7 @@ class MainWindow(QMainWindow):
 
                 if len(x_cols) > 1:
                     data = df[x_cols + [y_col]].dropna()
-                    data = data.copy()
-                    data["_x_label"] = data[x_cols].astype(str).agg(" / ".join, axis=1)
+                    data = data.assign(_x_label=joined_labels(data, x_cols))
                     x_key = "_x_label"
                 else:
                     data = df[[x_col, y_col]].dropna()
@@ -1745,31 +2272,20 @@ class MainWindow(QMainWindow):
                 chart = QChart()
                 chart.setMargins(QMargins(10, 10, 10, 30))
                 series = QBoxPlotSeries()
-                for key, group in data.groupby(x_key):
-                    values = group[y_col]
-                    q1 = values.quantile(0.25)
-                    median = values.quantile(0.5)
-                    q3 = values.quantile(0.75)
-                    vmin = values.min()
-                    vmax = values.max()
-                    box = QBoxSet(str(key))
-                    box.setValue(QBoxSet.LowerExtreme, float(vmin))
-                    box.setValue(QBoxSet.LowerQuartile, float(q1))
-                    box.setValue(QBoxSet.Median, float(median))
-                    box.setValue(QBoxSet.UpperQuartile, float(q3))
-                    box.setValue(QBoxSet.UpperExtreme, float(vmax))
-                    series.append(box)
+                codes, keys = pd.factorize(data[x_key], sort=True)
+                stats = box_stats(codes, numeric_values(data[y_col]).astype(np.float64), len(keys))
+                labels = keys.astype(str).tolist()
+                series.append([QBoxSet(*row, label) for row, label in zip(stats.tolist(), labels)])
 
                 chart.addSeries(series)
                 axis_x = QBarCategoryAxis()
-                axis_x.append([box.label() for box in series.boxes()])
+                axis_x.append(labels)
                 chart.addAxis(axis_x, Qt.AlignBottom)
                 series.attachAxis(axis_x)
                 axis_y = QValueAxis()
-                if not df[y_col].dropna().empty:
-                    y_min = float(df[y_col].min())
-                    y_max = float(df[y_col].max())
-                    axis_y.setRange(y_min, y_max)
+                y_range = value_range(df[y_col])
+                if y_range:
+                    axis_y.setRange(*y_range)
                 chart.addAxis(axis_y, Qt.AlignLeft)
                 series.attachAxis(axis_y)
                 chart.setTitle(cfg.title)
@@ -1792,50 +2308,40 @@ class MainWindow(QMainWindow):
                     data = df[group_cols + [y_col]].dropna()
                     y_field = y_col
             else:
-                if y_col is None or cfg.agg == "count":
-                    data = df.groupby(group_cols, dropna=False).size().reset_index(name="count")
-                    y_field = "count"
-                else:
-                    grouped = df.groupby(group_cols, dropna=False)[y_col].agg(cfg.agg)
-                    value_name = y_col
-                    if y_col in group_cols:
-                        value_name = f"{y_col}_{cfg.agg}"
-                        grouped = grouped.rename(value_name)
-                    data = grouped.reset_index()
-                    y_field = value_name
+                data, y_field = self.aggregate_for(df, group_cols, y_col, cfg.agg)
 
             use_multi_x = len(x_cols) > 1
             x_display_col = x_col
             if use_multi_x:
-                data = data.copy()
-                data["_x_label"] = data[x_cols].astype(str).agg(" / ".join, axis=1)
+                data = data.assign(_x_label=joined_labels(data, x_cols))
                 x_display_col = "_x_label"
 
             if cfg.top_n:
-                data = data.sort_values(y_field, ascending=False).head(cfg.top_n)
+                data = top_rows(data, y_field, cfg.top_n)
 
+            if color_col:
+                color_codes, color_keys = string_codes(data[color_col])
             chart = QChart()
             chart.setMargins(QMargins(10, 10, 10, 30))
             if chart_type == "Bar":
-                categories = data[x_display_col].astype(str).unique().tolist()
+                x_codes, categories = string_codes(data[x_display_col])
                 display_categories = self.format_axis_labels(categories)
                 series = QBarSeries()
                 if color_col:
-                    for key in data[color_col].astype(str).unique().tolist():
-                        subset = data[data[color_col].astype(str) == key]
-                        values = []
-                        for cat in categories:
-                            value = subset[subset[x_display_col].astype(str) == cat][y_field]
-                            values.append(float(value.iloc[0]) if not value.empty else 0.0)
+                    cells = color_codes * len(categories) + x_codes
+                    _, first = np.unique(cells, return_index=True)
+                    table = np.zeros((len(color_keys), len(categories)))
+                    table.ravel()[cells[first]] = numeric_values(data[y_field])[first]
+                    for key, values in zip(color_keys, table.tolist()):
                         bar_set = QBarSet(key)
                         bar_set.append(values)
                         attach_bar_tooltips(bar_set, categories)
                         series.append(bar_set)
                 else:
-                    values = [
-                        float(v)
-                        for v in data.set_index(x_display_col)[y_field].reindex(categories).fillna(0)
-                    ]
+                    values = numeric_values(data[y_field]).astype(np.float64)
+                    if len(categories) < len(values):
+                        values = values[np.unique(x_codes, return_index=True)[1]]
+                    values = np.where(np.isnan(values), 0.0, values).tolist()
                     bar_set = QBarSet(y_field)
                     bar_set.append(values)
                     attach_bar_tooltips(bar_set, categories)
@@ -1849,73 +2355,55 @@ class MainWindow(QMainWindow):
                 chart.addAxis(axis_x, Qt.AlignBottom)
                 series.attachAxis(axis_x)
                 axis_y = QValueAxis()
-                if not data[y_field].dropna().empty:
-                    y_max = float(data[y_field].max())
-                    axis_y.setRange(0, max(y_max * 1.1, 1))
+                y_range = value_range(data[y_field])
+                if y_range:
+                    axis_y.setRange(0, max(y_range[1] * 1.1, 1))
                 chart.addAxis(axis_y, Qt.AlignLeft)
                 series.attachAxis(axis_y)
             else:
-                if color_col:
-                    groups = data[color_col].astype(str).unique().tolist()
-                else:
-                    groups = [None]
+                groups = color_keys if color_col else [None]
 
                 x_mode = "value"
                 categories: List[str] = []
-                category_map: Dict[str, int] = {}
                 parsed_dates: Optional[pd.Series] = None
 
                 if use_multi_x:
                     x_mode = "category"
-                    categories = data[x_display_col].astype(str).unique().tolist()
-                    category_map = {cat: idx for idx, cat in enumerate(categories)}
+                elif pd.api.types.is_numeric_dtype(data[x_col]):
+                    x_mode = "value"
                 else:
-                    if pd.api.types.is_numeric_dtype(data[x_col]):
-                        x_mode = "value"
-                    else:
-                        parsed_dates = self._try_parse_datetime(data[x_col])
-                        if parsed_dates is not None:
-                            x_mode = "datetime"
-                            data = data.copy()
-                            data["_x_dt"] = parsed_dates
-                        else:
-                            x_mode = "category"
-                            categories = data[x_col].astype(str).unique().tolist()
-                            category_map = {cat: idx for idx, cat in enumerate(categories)}
-
-                for key in groups:
-                    subset = data if key is None else data[data[color_col].astype(str) == key]
-                    sort_col = x_display_col if x_mode == "category" else x_col
-                    subset = subset.sort_values(sort_col)
-                    series_name = str(key) if key is not None else y_field
+                    parsed_dates = self.chart_dates(data[x_col])
+                    x_mode = "datetime" if parsed_dates is not None else "category"
+
+                ys = numeric_values(data[y_field]).astype(np.float64)
+                if x_mode == "value":
+                    xs = numeric_values(data[x_col]).astype(np.float64)
+                    order = np.argsort(xs, kind="stable")
+                elif x_mode == "datetime":
+                    dated = parsed_dates.notna().to_numpy()
+                    xs = epoch_ms(parsed_dates).astype(np.float64)
+                    order = np.argsort(np.where(dated, xs, np.inf), kind="stable")
+                else:
+                    codes, categories = string_codes(data[x_display_col])
+                    xs = codes.astype(np.float64)
+                    order = category_order(data[x_display_col], codes, categories)
+                if not color_col:
+                    group_orders = [order]
+                else:
+                    group_orders = split_groups(order, color_codes[order], len(groups))
 
-                    def append_points(line_series: QLineSeries) -> None:
-                        for _, row in subset.iterrows():
-                            y_val = float(row[y_field])
-                            if x_mode == "value":
-                                line_series.append(float(row[x_col]), y_val)
-                            elif x_mode == "datetime":
-                                ts = pd.Timestamp(row["_x_dt"])  # type: ignore[index]
-                                ms = int(ts.value / 1_000_000)
-                                line_series.append(ms, y_val)
-                            else:
-                                key_val = str(row[x_display_col])
-                                line_series.append(category_map.get(key_val, 0), y_val)
-
-                    if chart_type == "Area":
-                        line = QLineSeries()
-                        line.setName(series_name)
-                        append_points(line)
-                        if line.count() < 2:
-                            chart.addSeries(line)
-                        else:
-                            area = QAreaSeries(line)
-                            area.setName(series_name)
-                            chart.addSeries(area)
+                for key, order in zip(groups, group_orders):
+                    series_name = str(key) if key is not None else y_field
+                    line = QLineSeries()
+                    line.setName(series_name)
+                    order = order[min_max_rows(ys[order], LINE_MAX_POINTS)]
+                    replace_points(line, xs[order], ys[order])
+                    if chart_type == "Area" and line.count() >= 2:
+                        area = QAreaSeries(line)
+                        area.setName(series_name)
+                        chart.addSeries(area)
                     else:
-                        line = QLineSeries()
-                        line.setName(series_name)
-                        append_points(line)
+                        line.setUseOpenGL(use_opengl(line.count()))
                         chart.addSeries(line)
 
                 if x_mode == "datetime":
@@ -1923,12 +2411,10 @@ class MainWindow(QMainWindow):
                     axis_x.setFormat("yyyy-MM-dd")
                     axis_x.setLabelsAngle(-45)
                     axis_x.setLabelsFont(self.axis_label_font())
-                    if parsed_dates is not None and not parsed_dates.dropna().empty:
-                        min_ms = int(parsed_dates.min().value / 1_000_000)
-                        max_ms = int(parsed_dates.max().value / 1_000_000)
+                    if dated.any():
                         axis_x.setRange(
-                            QDateTime.fromMSecsSinceEpoch(min_ms),
-                            QDateTime.fromMSecsSinceEpoch(max_ms),
+                            QDateTime.fromMSecsSinceEpoch(int(xs.min(where=dated, initial=np.inf))),
+                            QDateTime.fromMSecsSinceEpoch(int(xs.max(where=dated, initial=-np.inf))),
                         )
                 elif x_mode == "category":
                     axis_x = QBarCategoryAxis()
@@ -1939,14 +2425,14 @@ class MainWindow(QMainWindow):
                         axis_x.setRange(categories[0], categories[-1])
                 else:
                     axis_x = QValueAxis()
-                    if not data[x_col].dropna().empty:
-                        axis_x.setRange(float(data[x_col].min()), float(data[x_col].max()))
+                    x_range = array_range(xs)
+                    if x_range:
+                        axis_x.setRange(*x_range)
 
                 axis_y = QValueAxis()
-                if not data[y_field].dropna().empty:
-                    y_min = float(data[y_field].min())
-                    y_max = float(data[y_field].max())
-                    axis_y.setRange(y_min, y_max)
+                y_range = array_range(ys)
+                if y_range:
+                    axis_y.setRange(*y_range)
                 chart.addAxis(axis_x, Qt.AlignBottom)
                 chart.addAxis(axis_y, Qt.AlignLeft)
                 for s in chart.series():
@@ -1958,10 +2444,103 @@ class MainWindow(QMainWindow):
         except Exception as exc:
             return None, f"圖表發生錯誤: {exc}"
 
+    def histogram_for(self, df: pd.DataFrame, col: str, bins: int) -> Tuple[np.ndarray, np.ndarray]:
+        if df is not self.filtered_df:
+            return histogram(df[col], bins)
+        key = (col, bins)
+        if key not in self.histogram_cache:
+            self.histogram_cache[key] = histogram(df[col], bins)
+        return self.histogram_cache[key]
+
+    def aggregate_for(
+        self, df: pd.DataFrame, group_cols: List[str], y_col: Optional[str], agg: str
+    ) -> Tuple[pd.DataFrame, str]:
+        if df is not self.filtered_df:
+            return chart_aggregate(df, group_cols, y_col, agg)
+        key = (tuple(group_cols), y_col, agg)
+        if key not in self.aggregate_cache:
+            self.aggregate_cache[key] = chart_aggregate(df, group_cols, y_col, agg)
+        return self.aggregate_cache[key]
+
+    def filter_source(self, col: str) -> Dict[str, Any]:
+        if col in self.filter_sources:
+            return self.filter_sources[col]
+        series = self.column_series[col]
+        parsed = None
+        if not pd.api.types.is_numeric_dtype(series):
+            parsed = self.parsed_column(col)
+        if pd.api.types.is_numeric_dtype(series):
+            values = numeric_values(series)
+            source: Dict[str, Any] = {
+                "type": "numeric",
+                "values": values,
+                "range": array_range(values) or (0.0, 0.0),
+            }
+        elif parsed is not None:
+            epoch = local_ns(parsed)
+            source = {
+                "type": "datetime",
+                "series": parsed,
+                "epoch": epoch,
+                "sorted": bool((epoch[1:] >= epoch[:-1]).all()),
+                "min": parsed.min(),
+                "max": parsed.max(),
+            }
+        else:
+            options, codes, truncated = filter_options(series, 2000)
+            labels = options.astype(str)
+            order = np.argsort(labels.to_numpy(dtype=str), kind="stable")
+            rank = np.full(len(order) + 1, -1, dtype=np.int16)
+            rank[order] = np.arange(len(order))
+            source = {
+                "type": "categorical",
+                "labels": labels[order].tolist(),
+                "values": options[order].tolist(),
+                "codes": rank[codes],
+                "truncated": truncated,
+            }
+        self.filter_sources[col] = source
+        return source
+
+    def parsed_column(self, col: str) -> Optional[pd.Series]:
+        if col not in self.parsed_dates:
+            self.parsed_dates[col] = self._try_parse_datetime(self.column_series[col])
+        return self.parsed_dates[col]
+
+    def chart_dates(self, series: pd.Series) -> Optional[pd.Series]:
+        if pd.api.types.is_datetime64_any_dtype(series) or series.name not in self.column_series:
+            return self._try_parse_datetime(series)
+        if series.name not in self.date_lookups:
+            column = self.column_series[series.name]
+            # Same sample rejection as _try_parse_datetime; None records a column that is not dates.
+            lookup = None
+            if parse_dates(column[column.notna()].head(DATE_SAMPLE_SIZE)).notna().mean() >= 0.6:
+                uniques = pd.Index(column.unique())
+                lookup = pd.Series(pd.to_datetime(uniques, errors="coerce"), index=uniques)
+            self.date_lookups[series.name] = lookup
+        lookup = self.date_lookups[series.name]
+        if lookup is None:
+            return None
+        codes, uniques = pd.factorize(series)
+        parsed = pd.Series(
+            pd.Index(lookup.reindex(uniques)).take(codes, allow_fill=True, fill_value=pd.NaT),
+            index=series.index,
+            name=series.name,
+        )
+        if parsed.notna().mean() >= 0.6:
+            return parsed
+        return None
+
     def _try_parse_datetime(self, series: pd.Series) -> Optional[pd.Series]:
         if pd.api.types.is_datetime64_any_dtype(series):
             return series
-        parsed = pd.to_datetime(series, errors="coerce")
+        present = series.notna()
+        if present.mean() < 0.6:
+            return None
+        sample = series[present].head(DATE_SAMPLE_SIZE)
+        if parse_dates(sample).notna().mean() < 0.6:
+            return None
+        parsed = parse_dates(series)
         if parsed.notna().mean() >= 0.6:
             return parsed
         return None
@@ -1969,13 +2548,16 @@ class MainWindow(QMainWindow):
     def format_axis_labels(self, labels: List[str], max_len: int = 16) -> List[str]:
         full = getattr(self, "full_labels_checkbox", None)
         use_full = bool(full and full.isChecked())
+        texts = [label.replace(" / ", "\n") for label in labels]
+        if not use_full:
+            texts = [
+                text if len(text) <= max_len else text.replace("\n", " ")[: max_len - 1] + "…" for text in texts
+            ]
+        if len(set(texts)) == len(texts):
+            return texts
         formatted: List[str] = []
         seen: Dict[str, int] = {}
-        for label in labels:
-            text = label.replace(" / ", "\n")
-            raw = text.replace("\n", " ")
-            if not use_full and len(raw) > max_len:
-                text = raw[: max_len - 1] + "…"
+        for text in texts:
             if text in seen:
                 seen[text] += 1
                 text = f"{text}({seen[text]})"
@@ -2002,15 +2584,13 @@ class MainWindow(QMainWindow):
         if isinstance(pivot, pd.Series):
             data_df = pivot.to_frame(name="value")
         else:
-            data_df = pivot.copy()
+            data_df = pivot.copy(deep=False)
 
         if isinstance(data_df.columns, pd.MultiIndex):
-            data_df.columns = [
-                " / ".join([str(c) for c in col if c != ""]) for col in data_df.columns
-            ]
+            data_df.columns = flatten_column_labels(data_df.columns)
 
         if data_df.index.nlevels > 1:
-            data_df.index = [" / ".join([str(v) for v in idx]) for idx in data_df.index]
+            data_df.index = index_labels(data_df.index)
 
         data_df = data_df.fillna(0)
         if data_df.empty:
@@ -2024,16 +2604,16 @@ class MainWindow(QMainWindow):
         axis_x.setLabelsAngle(-45)
         axis_x.setLabelsFont(self.axis_label_font())
         axis_y = QValueAxis()
+        values = data_df.to_numpy(dtype=np.float64)
+        xs = np.arange(len(values), dtype=np.float64)
+        max_val = float(np.nanmax(values))
 
         if chart_type == "折線":
-            max_val = 0.0
-            for col in data_df.columns:
+            for col, column in zip(data_df.columns, values.T):
                 line = QLineSeries()
                 line.setName(str(col))
-                for idx, value in enumerate(data_df[col].tolist()):
-                    line.append(float(idx), float(value))
+                replace_points(line, xs, column)
                 chart.addSeries(line)
-                max_val = max(max_val, float(np.nanmax(data_df[col].values)))
             chart.addAxis(axis_x, Qt.AlignBottom)
             chart.addAxis(axis_y, Qt.AlignLeft)
             for s in chart.series():
@@ -2042,10 +2622,9 @@ class MainWindow(QMainWindow):
             axis_y.setRange(0, max(max_val * 1.1, 1))
         else:
             bar_series = QBarSeries()
-            for col in data_df.columns:
+            for col, column in zip(data_df.columns, values.T):
                 bar_set = QBarSet(str(col))
-                values = [float(v) for v in data_df[col].tolist()]
-                bar_set.append(values)
+                bar_set.append(column.tolist())
                 attach_bar_tooltips(bar_set, categories)
                 bar_series.append(bar_set)
 
@@ -2055,20 +2634,18 @@ class MainWindow(QMainWindow):
             bar_series.attachAxis(axis_x)
             bar_series.attachAxis(axis_y)
 
-            max_val = float(np.nanmax(data_df.values))
             axis_y.setRange(0, max(max_val * 1.1, 1))
 
             if chart_type == "長條+折線":
                 if data_df.shape[1] > 1:
-                    line_values = data_df.sum(axis=1).tolist()
+                    line_values = values.sum(axis=1)
                     line_name = "總和"
                 else:
-                    line_values = data_df.iloc[:, 0].tolist()
+                    line_values = values[:, 0]
                     line_name = str(data_df.columns[0])
                 line = QLineSeries()
                 line.setName(line_name)
-                for idx, value in enumerate(line_values):
-                    line.append(float(idx), float(value))
+                replace_points(line, xs, line_values)
                 chart.addSeries(line)
                 line.attachAxis(axis_x)
                 line.attachAxis(axis_y)
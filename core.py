@@ -1,20 +1,44 @@
 from __future__ import annotations
 
-import json
+import codecs
+import logging
+import os
+import shutil
 import sys
 import traceback
 from datetime import datetime
+from logging.handlers import MemoryHandler
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
+import orjson
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+except ImportError:
+    pa = None
+    pa_csv = None
+    pa_parquet = None
+
 BASE_DIR = Path(sys.executable).resolve().parent if getattr(sys, "frozen", False) else Path(__file__).resolve().parent
 DATA_DIR = BASE_DIR / "data"
 HISTORY_DIR = DATA_DIR / "history"
 CONFIG_PATH = DATA_DIR / "config.json"
 LATEST_CSV = DATA_DIR / "latest.csv"
+LATEST_PARQUET = DATA_DIR / "latest.parquet"
 LOG_PATH = DATA_DIR / "update.log"
+_config_cache: Optional[tuple[tuple[int, int], dict]] = None
+_latest_cache: Optional[tuple[tuple[int, int], pd.DataFrame]] = None
+ARROW_BLOCK_SIZE = 16 << 20
+ARROW_SAMPLE_BYTES = 1 << 20
+ENCODING_SAMPLE_BYTES = 64 << 10
+MMAP_MIN_BYTES = 1 << 20
+LOG_BUFFER_RECORDS = 16
+ENCODING_CANDIDATES = ("utf-8-sig", "utf-8", "cp950", "big5", "latin1")
 
 DEFAULT_CONFIG = {
     "source_path": "",
@@ -27,6 +51,8 @@ DEFAULT_CONFIG = {
     "last_source": "",
     "last_error": "",
     "last_history": "",
+    "column_types": {},
+    "source_fingerprint": [],
 }
 
 
@@ -44,77 +70,237 @@ def today_str() -> str:
 
 
 def load_config() -> dict:
+    global _config_cache
     ensure_data_dir()
-    if CONFIG_PATH.exists():
+    try:
+        stat = CONFIG_PATH.stat()
+    except FileNotFoundError:
+        return DEFAULT_CONFIG.copy()
+    key = (stat.st_mtime_ns, stat.st_size)
+    if _config_cache is None or _config_cache[0] != key:
         try:
-            with CONFIG_PATH.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-            return {**DEFAULT_CONFIG, **data}
+            with CONFIG_PATH.open("rb") as f:
+                _config_cache = (key, {**DEFAULT_CONFIG, **orjson.loads(f.read())})
         except Exception:
             return DEFAULT_CONFIG.copy()
-    return DEFAULT_CONFIG.copy()
+    return _config_cache[1].copy()
 
 
 def save_config(cfg: dict) -> None:
+    global _config_cache
     ensure_data_dir()
-    with CONFIG_PATH.open("w", encoding="utf-8") as f:
-        json.dump(cfg, f, indent=2, ensure_ascii=False)
+    with CONFIG_PATH.open("wb") as f:
+        f.write(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+    _config_cache = None
 
 
-def log_event(message: str) -> None:
+def update_logger() -> logging.Logger:
+    logger = logging.getLogger("csv_dashboard.update")
+    if logger.handlers:
+        return logger
     ensure_data_dir()
-    line = f"[{now_str()}] {message}\n"
-    with LOG_PATH.open("a", encoding="utf-8") as f:
-        f.write(line)
+    # The app and the scheduled updater both append here, so the file is not size-rotated and is
+    # only held open while a buffer is being written out.
+    handler = logging.FileHandler(LOG_PATH, encoding="utf-8", delay=True)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(MemoryHandler(LOG_BUFFER_RECORDS, flushLevel=logging.ERROR, target=handler))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    return logger
+
+
+def log_event(message: str, level: int = logging.INFO) -> None:
+    update_logger().log(level, f"[{now_str()}] {message}")
+
+
+def flush_log() -> None:
+    buffer = update_logger().handlers[0]
+    buffer.flush()
+    buffer.target.close()
 
 
 def normalize_path(path_str: str) -> Path:
     return Path(path_str).expanduser()
 
 
-def read_csv_safely(path: Path, encoding: str) -> pd.DataFrame:
+def sniff_encoding(path: Path) -> str:
+    with path.open("rb") as f:
+        head = f.read(ENCODING_SAMPLE_BYTES)
+    for enc in ENCODING_CANDIDATES:
+        try:
+            # Incremental decoding tolerates a multibyte character cut off at the sample boundary.
+            codecs.getincrementaldecoder(enc)().decode(head)
+            return enc
+        except UnicodeDecodeError:
+            continue
+    return ENCODING_CANDIDATES[-1]
+
+
+def read_csv_safely(path: Path, encoding: str, column_types: Optional[dict] = None) -> pd.DataFrame:
+    sniffed = sniff_encoding(path) if encoding == "auto" else encoding
+    if pa_csv is not None:
+        arrow_encoding = "utf8" if sniffed in ("utf-8", "utf-8-sig") else sniffed
+        if column_types:
+            try:
+                return read_csv_arrow(path, arrow_encoding, column_types)
+            except (UnicodeError, pa.ArrowInvalid):
+                pass
+        try:
+            return read_csv_arrow(path, arrow_encoding)
+        except (UnicodeError, pa.ArrowInvalid):
+            pass
     if encoding != "auto":
-        return pd.read_csv(path, encoding=encoding)
+        return read_csv_pandas(path, encoding)
 
-    try:
-        return pd.read_csv(path)
-    except UnicodeDecodeError:
-        for enc in ["utf-8-sig", "utf-8", "cp950", "big5", "latin1"]:
-            try:
-                return pd.read_csv(path, encoding=enc)
-            except UnicodeDecodeError:
-                continue
-        raise
+    # The sample can pass while later bytes do not, so keep trying the remaining candidates.
+    fallbacks = ENCODING_CANDIDATES[ENCODING_CANDIDATES.index(sniffed) + 1 :]
+    for enc in (sniffed, *fallbacks):
+        try:
+            return read_csv_pandas(path, enc)
+        except UnicodeDecodeError:
+            continue
+    raise UnicodeError(f"{path} does not match any of {', '.join(ENCODING_CANDIDATES)}")
+
+
+def read_csv_pandas(path: Path, encoding: Optional[str] = None) -> pd.DataFrame:
+    # Mapping the file only pays off once it is past a page-cache-sized read.
+    return pd.read_csv(path, encoding=encoding, engine="c", memory_map=path.stat().st_size > MMAP_MIN_BYTES)
+
+
+def pandas_header(path: Path, encoding: Optional[str] = None) -> list[str]:
+    return [str(col) for col in pd.read_csv(path, encoding=encoding, nrows=0).columns]
+
+
+def read_csv_arrow(path: Path, encoding: str = "utf8", column_types: Optional[dict] = None) -> pd.DataFrame:
+    types = {col: pa.type_for_alias(name) for col, name in (column_types or {}).items()}
+    # Replayed types are keyed by pandas' names, so take the header from pandas before Arrow binds them.
+    header = pandas_header(path, encoding) if types else None
+    options = {"encoding": encoding, "skip_rows": 1 if header else 0, "column_names": header}
+    # Names and inferred types come from the first block, so the whole file is parsed only once below.
+    with pa_csv.open_csv(
+        path,
+        read_options=pa_csv.ReadOptions(block_size=ARROW_SAMPLE_BYTES, **options),
+        convert_options=pa_csv.ConvertOptions(strings_can_be_null=True, column_types=types),
+    ) as reader:
+        schema = reader.schema
+    # Arrow keeps duplicate and blank headers as written; use pandas' names (a.1, Unnamed: N) instead.
+    if len(set(schema.names)) < len(schema.names) or "" in schema.names:
+        options.update(skip_rows=1, column_names=pandas_header(path, encoding))
+    names = options["column_names"] or schema.names
+    # Arrow parses dates and timestamps on its own and trims them on the way; read them as their source text
+    # like pd.read_csv does.
+    texts = [name for name, field in zip(names, schema) if pa.types.is_temporal(field.type)]
+    while True:
+        table = pa_csv.read_csv(
+            path,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE, **options),
+            convert_options=pa_csv.ConvertOptions(
+                strings_can_be_null=True, column_types={**types, **dict.fromkeys(texts, pa.string())}
+            ),
+        )
+        # A column left empty in the first block can still be inferred as a date further down.
+        late = [field.name for field in table.schema if pa.types.is_temporal(field.type)]
+        if not late:
+            break
+        texts += late
+    # Undecodable text comes back as binary columns instead of an error.
+    if any(pa.types.is_binary(field.type) for field in table.schema):
+        raise UnicodeError(f"{path} is not valid {encoding} text")
+    return arrow_to_pandas(table)
+
+
+def arrow_column_types(df: pd.DataFrame) -> dict:
+    # Types to replay on the next read of the same feed, which skips Arrow's type inference. Text columns
+    # are left to inference: a replayed string type never fails, so a stray "-" would pin a number column to text.
+    return {
+        str(col): str(pa.from_numpy_dtype(dtype))
+        for col, dtype in df.dtypes.items()
+        if isinstance(dtype, np.dtype) and dtype.kind in "biuf"
+    }
+
+
+def arrow_to_pandas(table: "pa.Table") -> pd.DataFrame:
+    strings = pd.StringDtype("pyarrow")
+    return table.to_pandas(types_mapper={pa.string(): strings, pa.large_string(): strings}.get)
+
+
+def with_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    if pa is None:
+        return df
+    cols = [
+        col
+        for col, dtype in df.dtypes.items()
+        if dtype == object and pd.api.types.infer_dtype(df[col], skipna=True) == "string"
+    ]
+    return df.astype({col: pd.StringDtype("pyarrow") for col in cols}) if cols else df
+
+
+def invalidate_latest_cache() -> None:
+    global _latest_cache
+    _latest_cache = None
 
 
 def save_latest(df: pd.DataFrame) -> None:
+    invalidate_latest_cache()
     ensure_data_dir()
-    df.to_csv(LATEST_CSV, index=False)
+    # Write beside and swap in, so history files hard-linked to the previous latest.csv keep their contents.
+    staging = LATEST_CSV.with_name(LATEST_CSV.name + ".tmp")
+    df.to_csv(staging, index=False)
+    os.replace(staging, LATEST_CSV)
+    if pa is None:
+        return
+    try:
+        df.to_parquet(LATEST_PARQUET, compression="zstd", index=False)
+    except (pa.ArrowException, OSError, TypeError, ValueError) as exc:
+        LATEST_PARQUET.unlink(missing_ok=True)
+        log_event(f"parquet cache skipped: {exc}")
 
 
-def save_history(df: pd.DataFrame) -> str:
+def save_history() -> str:
     ensure_data_dir()
     history_path = HISTORY_DIR / f"history_{today_str()}.csv"
-    df.to_csv(history_path, index=False)
+    history_path.unlink(missing_ok=True)
+    try:
+        os.link(LATEST_CSV, history_path)
+    except OSError:
+        shutil.copyfile(LATEST_CSV, history_path)
     return str(history_path)
 
 
+def latest_stamp() -> list:
+    try:
+        stat = LATEST_CSV.stat()
+    except FileNotFoundError:
+        return []
+    return [stat.st_mtime_ns, stat.st_size]
+
+
 def update_from_path(path_str: str, encoding: str, source: str) -> pd.DataFrame:
     path = normalize_path(path_str)
     if not path.exists():
         raise FileNotFoundError(f"找不到檔案: {path}")
-    df = read_csv_safely(path, encoding)
-    save_latest(df)
-
     cfg = load_config()
+    stat = path.stat()
+    fingerprint = [str(path.resolve()), encoding, stat.st_mtime_ns, stat.st_size]
+    # latest.csv's own stat is part of the match, so a latest.csv rewritten by an update that failed
+    # later on is never taken for the previous source.
+    df = load_latest_df() if cfg.get("source_fingerprint") == fingerprint + latest_stamp() else None
+    if df is None:
+        df = read_csv_safely(path, encoding, cfg.get("column_types"))
+        save_latest(df)
+    else:
+        log_event(f"source unchanged, reusing latest.csv (path={path})")
+
     history_path = ""
     if cfg.get("keep_history", True):
-        history_path = save_history(df)
+        history_path = save_history()
 
     cfg["source_path"] = path_str
     cfg["encoding"] = encoding
     cfg["last_updated"] = now_str()
     cfg["last_source"] = source
+    cfg["column_types"] = arrow_column_types(df) if pa is not None else {}
+    cfg["source_fingerprint"] = fingerprint + latest_stamp()
     cfg["last_error"] = ""
     if history_path:
         cfg["last_history"] = history_path
@@ -125,9 +311,30 @@ def update_from_path(path_str: str, encoding: str, source: str) -> pd.DataFrame:
 
 
 def load_latest_df() -> Optional[pd.DataFrame]:
-    if not LATEST_CSV.exists():
+    global _latest_cache
+    try:
+        stat = LATEST_CSV.stat()
+    except FileNotFoundError:
         return None
-    return pd.read_csv(LATEST_CSV)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _latest_cache
+    if cached is None or cached[0] != key:
+        cached = _latest_cache = (key, read_latest())
+    # app.py runs with copy-on-write, so edits to the shallow copy never reach the cache.
+    return cached[1].copy(deep=False)
+
+
+def read_latest() -> pd.DataFrame:
+    if (
+        pa is not None
+        and LATEST_PARQUET.exists()
+        and LATEST_PARQUET.stat().st_mtime >= LATEST_CSV.stat().st_mtime
+    ):
+        # Without the pandas metadata, strings map to the same dtype as the CSV path.
+        return arrow_to_pandas(pa_parquet.read_table(LATEST_PARQUET).replace_schema_metadata())
+    if pa_csv is not None:
+        return read_csv_arrow(LATEST_CSV)
+    return read_csv_pandas(LATEST_CSV)
 
 
 def safe_update(path_str: str, encoding: str, source: str) -> tuple[Optional[pd.DataFrame], Optional[str]]:
@@ -139,5 +346,7 @@ def safe_update(path_str: str, encoding: str, source: str) -> tuple[Optional[pd.
         cfg["last_error"] = f"{exc}"
         save_config(cfg)
         log_event(f"update failed: {exc}")
-        log_event(traceback.format_exc())
+        log_event(traceback.format_exc(), logging.ERROR)
         return None, str(exc)
+    finally:
+        flush_log()
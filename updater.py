@@ -3,10 +3,18 @@ from __future__ import annotations
 import sys
 import re
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 from core import load_config, safe_update, log_event
 
+DATE_TOKEN_RE = re.compile(r"\{date(?::([^}]+))?\}")
+
+
+@lru_cache(maxsize=None)
+def trailing_digits_re(width: int) -> re.Pattern[str]:
+    return re.compile(rf"(\d{{{width}}})(?!.*\d)")
+
 
 def resolve_source_path(raw_path: str, use_date_template: bool, date_format: str) -> str:
     if not raw_path:
@@ -15,18 +23,18 @@ def resolve_source_path(raw_path: str, use_date_template: bool, date_format: str
         return raw_path
 
     fmt = date_format or "%m%d"
-    today_str = datetime.now().strftime(fmt)
+    now = datetime.now()
+    today_str = now.strftime(fmt)
 
     if "{date" in raw_path:
         def replace(match: re.Match[str]) -> str:
             fmt_override = match.group(1) or fmt
-            return datetime.now().strftime(fmt_override)
+            return now.strftime(fmt_override)
 
-        return re.sub(r"\{date(?::([^}]+))?\}", replace, raw_path)
+        return DATE_TOKEN_RE.sub(replace, raw_path)
 
     name = Path(raw_path).name
-    pattern = rf"(\d{{{len(today_str)}}})(?!.*\d)"
-    new_name = re.sub(pattern, today_str, name, count=1)
+    new_name = trailing_digits_re(len(today_str)).sub(today_str, name, count=1)
     if new_name != name:
         return str(Path(raw_path).with_name(new_name))
     return raw_path